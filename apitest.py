@@ -1,13 +1,49 @@
-import os
-from dotenv import load_dotenv
+import asyncio
 from langchain_google_genai import ChatGoogleGenerativeAI
 from google.api_core.exceptions import InvalidArgument, Unauthenticated
 
-# Load environment variables from .env file
-load_dotenv()
+from src import env
+
+# 1. SETUP: Get API key from environment (or .env) or use test key
+TEST_KEY = env.get("GOOGLE_API_KEY") or "YOUR_PASTED_API_KEY_HERE"
+
+async def probe_model(model_name):
+    """Build a client for one model and confirm it answers."""
+    llm = ChatGoogleGenerativeAI(
+        model=model_name,
+        google_api_key=TEST_KEY,
+        temperature=0.0,
+        max_retries=1  # Fail fast
+    )
+    # Quick test invocation
+    await llm.ainvoke("Hi")
+    return model_name, llm
+
+
+async def find_working_model(models_to_try):
+    """Probe all models concurrently and return the first one that answers."""
+    tasks = {asyncio.create_task(probe_model(m)): m for m in models_to_try}
+    pending = set(tasks)
+    
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                model_name = tasks[task]
+                error = task.exception()
+                if error is None:
+                    print(f"✅ Model {model_name} works!")
+                    return task.result()
+                if isinstance(error, InvalidArgument):
+                    print(f"   ⚠️  Model {model_name} not available: {str(error)[:100]}")
+                else:
+                    print(f"   ⚠️  Model {model_name} failed: {type(error).__name__}")
+    finally:
+        for task in pending:
+            task.cancel()
+    
+    return None, None
 
-# 1. SETUP: Get API key from environment or use test key
-TEST_KEY = os.getenv("GOOGLE_API_KEY") or "YOUR_PASTED_API_KEY_HERE"
 
 def run_vibe_check():
     print(f"--- 📡 Initiating Gemini API Vibe Check ---")
@@ -31,29 +67,8 @@ def run_vibe_check():
         "gemini-3-pro-preview"  # Latest preview
     ]
     
-    llm = None
-    working_model = None
-    
-    for model_name in models_to_try:
-        try:
-            print(f"\n🔄 Trying model: {model_name}...")
-            llm = ChatGoogleGenerativeAI(
-                model=model_name,
-                google_api_key=TEST_KEY,
-                temperature=0.0,
-                max_retries=1  # Fail fast
-            )
-            # Quick test invocation
-            test_response = llm.invoke("Hi")
-            working_model = model_name
-            print(f"✅ Model {model_name} works!")
-            break
-        except InvalidArgument as e:
-            print(f"   ⚠️  Model {model_name} not available: {str(e)[:100]}")
-            continue
-        except Exception as e:
-            print(f"   ⚠️  Model {model_name} failed: {type(e).__name__}")
-            continue
+    print(f"\n🔄 Trying models: {', '.join(models_to_try)}...")
+    working_model, llm = asyncio.run(find_working_model(models_to_try))
     
     if not llm:
         print("\n❌ ERROR: Could not initialize any model!")
@@ -1,6 +1,5 @@
 """Demo script to show LLM usage in the agent."""
 
-import os
 import sys
 from pathlib import Path
 
@@ -9,11 +8,11 @@ project_root = Path(__file__).parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from dotenv import load_dotenv
+from src import env
 from src.modes import ask_speed, ask_quality, process_speed, process_quality
 from src.config import AgentConfig
 
-load_dotenv()
+QUALITY_CFG = AgentConfig(default_mode="quality", cache_enabled=True)
 
 def demo_question_generation():
     """Show difference between Speed and Quality mode questions."""
@@ -38,9 +37,8 @@ def demo_question_generation():
     
     # Quality Mode
     print("\n🧠 QUALITY MODE (LLM-generated, contextual):")
-    config = AgentConfig(default_mode="quality")
     try:
-        quality_question = ask_quality(field, context, config)
+        quality_question = ask_quality(field, context, QUALITY_CFG)
         print(f"   {quality_question}")
     except Exception as e:
         import traceback
@@ -69,9 +67,8 @@ def demo_value_extraction():
     
     # Quality Mode
     print("\n🧠 QUALITY MODE (LLM extraction):")
-    config = AgentConfig(default_mode="quality")
     try:
-        quality_result = process_quality(user_input, field, config)
+        quality_result = process_quality(user_input, field, QUALITY_CFG)
         print(f"   Extracted: {quality_result.get('value')}")
         print(f"   Confidence: {quality_result.get('confidence')}")
         print(f"   Method: {quality_result.get('extraction_method')}")
@@ -97,7 +94,7 @@ if __name__ == "__main__":
     print("=" * 70)
     
     # Check API key
-    api_key = os.getenv("GOOGLE_API_KEY")
+    api_key = env.get("GOOGLE_API_KEY")
     if not api_key:
         print("\n⚠️  WARNING: No GOOGLE_API_KEY found in .env file!")
         print("   Quality Mode demos will fail.")
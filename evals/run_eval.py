@@ -1,26 +1,31 @@
 """Enhanced evaluation script for the Dynamic Intake Form Agent."""
 
+import re
 import sys
-import json
+import asyncio
 import time
 import argparse
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Any, BinaryIO, Dict, List, Optional
 from dataclasses import dataclass
-from unittest.mock import MagicMock, patch
+from functools import lru_cache
+
+import orjson
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from langchain_core.messages import HumanMessage
-from langgraph.checkpoint.memory import MemorySaver
-
-from src.graph import create_intake_graph
-from src.nodes import set_config
+# langchain/langgraph and the graph are imported where they are first
+# needed, so `--help` and argument errors return without loading them
 from src.config import AgentConfig
 
+# Cap on concurrently running cases (keeps real-LLM runs under rate limits)
+MAX_CONCURRENCY = 8
+
+_CFG_BY_MODE = {m: AgentConfig(default_mode=m) for m in ("speed", "quality", "hybrid")}
+
 @dataclass
 class TestCase:
     id: str
@@ -29,10 +34,13 @@ class TestCase:
     expected_values: Dict[str, Any]
     mode: str = "hybrid"
 
-def load_test_cases(path: str) -> List[TestCase]:
-    with open(path, "r") as f:
-        data = json.load(f)
-    return [TestCase(**item) for item in data]
+def load_test_cases(path: str, mode_filter: Optional[str] = None) -> List[TestCase]:
+    with open(path, "rb") as f:
+        data = orjson.loads(f.read())
+    return [
+        TestCase(**item) for item in data
+        if mode_filter in (None, "all") or item.get("mode", "hybrid") == mode_filter
+    ]
 
 def create_test_schema():
     return {
@@ -64,46 +72,108 @@ def create_test_schema():
         ]
     }
 
+_NON_DIGIT_RE = re.compile(r"\D")
+
+def _number_eq(actual, expected) -> bool:
+    try:
+        return float(actual) == float(expected)
+    except (TypeError, ValueError):
+        return False
+
+def _email_eq(actual, expected) -> bool:
+    return isinstance(actual, str) and actual.lower() == expected.lower()
+
+def _phone_eq(actual, expected) -> bool:
+    return isinstance(actual, str) and _NON_DIGIT_RE.sub("", actual) == _NON_DIGIT_RE.sub("", expected)
+
+# field_type -> equality check for collected vs expected values
+_COMPARE = {
+    "number": _number_eq,
+    "email": _email_eq,
+    "phone": _phone_eq,
+    None: lambda actual, expected: actual == expected,
+}
+
+# Mock LLM payloads, serialized once
+_RESP_SARAH = orjson.dumps({"value": "Sarah Connor", "confidence": 0.95}).decode()
+_RESP_EMAIL = orjson.dumps({"value": "sarah.connor@skynet.com", "confidence": 0.95}).decode()
+_RESP_PHONE = orjson.dumps({"value": "(555) 987-6543", "confidence": 0.95}).decode()
+_RESP_AGE = orjson.dumps({"value": 30.0, "confidence": 0.95}).decode()
+_RESP_VERIFIED = orjson.dumps({"valid": True, "needs_clarification": False}).decode()
+_RESP_NO_NOTES = orjson.dumps({"notes": []}).decode()
+
+_QUESTION_MAP = {
+    "Full Name": "What is your full name?",
+    "Email Address": "What is your email address?",
+    "Phone Number": "What is your phone number?",
+    "Age": "How old are you?",
+}
+
+_EXTRACT_MAP = {
+    "Sarah Connor": _RESP_SARAH,
+    "sarah.connor@skynet.com": _RESP_EMAIL,
+    "555-987-6543": _RESP_PHONE,
+    "thirty years old": _RESP_AGE,
+}
+
+_UNKNOWN = "I don't know"
+
+def _alternation(keys) -> re.Pattern:
+    return re.compile("|".join(re.escape(key) for key in keys))
+
+def _lookup(pattern: re.Pattern, table: Dict[str, Any], content: str) -> Any:
+    match = pattern.search(content)
+    return table[match.group(0)] if match else _UNKNOWN
+
+_QUESTION_RE = _alternation(_QUESTION_MAP)
+_EXTRACT_RE = _alternation(_EXTRACT_MAP)
+
+# Prompt marker -> responder; the earliest marker in the prompt wins
+_ROUTES = {
+    "Generate a natural, conversational question": lambda content: _lookup(_QUESTION_RE, _QUESTION_MAP, content),
+    "Extract the": lambda content: _lookup(_EXTRACT_RE, _EXTRACT_MAP, content),
+    "Verify this extracted value": lambda content: _RESP_VERIFIED,
+    "Analyze this response": lambda content: _RESP_NO_NOTES,
+}
+_ROUTE_RE = _alternation(_ROUTES)
+
+@lru_cache(maxsize=1)
+def get_graph():
+    """Compile the graph once; each case runs on its own thread_id.
+    
+    Runs use durability="exit" so state is checkpointed only at each interrupt.
+    """
+    from langgraph.checkpoint.memory import MemorySaver
+    from src.graph import create_intake_graph
+    return create_intake_graph(checkpointer=MemorySaver(), form_schema=create_test_schema())
+
 def mock_llm_response(prompt):
-    content = prompt[0].content
-    if "Generate a natural, conversational question" in content:
-        if "Full Name" in content: return "What is your full name?"
-        if "Email Address" in content: return "What is your email address?"
-        if "Phone Number" in content: return "What is your phone number?"
-        if "Age" in content: return "How old are you?"
-    
-    if "Extract the" in content:
-        if "Sarah Connor" in content: return json.dumps({"value": "Sarah Connor", "confidence": 0.95})
-        if "sarah.connor@skynet.com" in content: return json.dumps({"value": "sarah.connor@skynet.com", "confidence": 0.95})
-        if "555-987-6543" in content: return json.dumps({"value": "(555) 987-6543", "confidence": 0.95})
-        if "thirty years old" in content: return json.dumps({"value": 30.0, "confidence": 0.95})
-        
-    if "Verify this extracted value" in content:
-        return json.dumps({"valid": True, "needs_clarification": False})
-        
-    if "Analyze this response" in content:
-        return json.dumps([])
-        
-    return "I don't know"
+    # Prompts are a static system prefix plus a dynamic human tail
+    content = "\n".join(message.content for message in prompt)
+    match = _ROUTE_RE.search(content)
+    return _ROUTES[match.group(0)](content) if match else _UNKNOWN
 
-def run_test_case(test_case: TestCase) -> Dict[str, Any]:
-    print(f"\nRunning Test Case: {test_case.id}")
-    print(f"Description: {test_case.description}")
-    print(f"Mode: {test_case.mode}")
+def create_mock_llm():
+    from unittest.mock import AsyncMock, MagicMock
     
-    # Setup
-    config = AgentConfig(default_mode=test_case.mode)
-    set_config(config)
-    checkpointer = MemorySaver()
+    def structured(schema, **kwargs):
+        # Mock payloads are JSON, parsed into the requested output schema
+        structured_llm = MagicMock()
+        structured_llm.invoke.side_effect = lambda x: schema.model_validate_json(mock_llm_response(x))
+        structured_llm.ainvoke = AsyncMock(side_effect=structured_llm.invoke.side_effect)
+        return structured_llm
     
-    # Mock LLM
-    with patch('src.modes.get_llm') as mock_get_llm:
-        mock_llm = MagicMock()
-        mock_llm.invoke.side_effect = lambda x: MagicMock(content=mock_llm_response(x))
-        mock_get_llm.return_value = mock_llm
-        
-        graph = create_intake_graph(checkpointer=checkpointer)
-        
+    mock_llm = MagicMock()
+    mock_llm.invoke.side_effect = lambda x: MagicMock(content=mock_llm_response(x))
+    mock_llm.ainvoke = AsyncMock(side_effect=mock_llm.invoke.side_effect)
+    mock_llm.with_structured_output.side_effect = structured
+    return mock_llm
+
+async def arun_test_case(test_case: TestCase, semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+    from langchain_core.messages import HumanMessage
+    
+    async with semaphore:
+        graph = get_graph()
         schema = create_test_schema()
         initial_state = {
             "messages": [],
@@ -122,56 +192,95 @@ def run_test_case(test_case: TestCase) -> Dict[str, Any]:
         
         start_time = time.time()
         
-        # Initial run
-        for event in graph.stream(initial_state, config_run):
-            pass
+        # Initial run; ainvoke returns the state at the interrupt
+        values = await graph.ainvoke(initial_state, config_run, durability="exit")
         
-        current_state = graph.get_state(config_run)
         input_idx = 0
         
-        while not current_state.values.get("is_complete") and input_idx < len(test_case.inputs):
+        while not values.get("is_complete") and input_idx < len(test_case.inputs):
             user_input = test_case.inputs[input_idx]
-            # print(f"  Input: {user_input}")
             
-            graph.update_state(
+            await graph.aupdate_state(
                 config_run,
                 {"messages": [HumanMessage(content=user_input)]},
             )
             
-            for event in graph.stream(None, config_run):
-                pass
+            values = await graph.ainvoke(None, config_run, durability="exit")
                 
-            current_state = graph.get_state(config_run)
             input_idx += 1
             
         end_time = time.time()
         duration = end_time - start_time
+    
+    # Verify results
+    collected = values.get("collected_fields", {})
+    passed = True
+    failures = []
+    
+    field_types = {f["id"]: f["field_type"] for f in schema["fields"]}
+    for field_id, expected in test_case.expected_values.items():
+        actual = collected.get(field_id, {}).get("value")
+        compare = _COMPARE.get(field_types.get(field_id), _COMPARE[None])
+        if not compare(actual, expected):
+            passed = False
+            failures.append(f"{field_id}: Expected '{expected}', Got '{actual}'")
+    
+    # Cases finish out of order, so print each case's report in one block
+    status = "PASSED" if passed else "FAILED"
+    lines = [
+        f"\nRunning Test Case: {test_case.id}",
+        f"Description: {test_case.description}",
+        f"Mode: {test_case.mode}",
+        f"  Status: {status} ({duration:.2f}s)",
+    ]
+    lines.extend(f"    ❌ {f}" for f in failures)
+    print("\n".join(lines), flush=True)
+            
+    return {
+        "id": test_case.id,
+        "passed": passed,
+        "duration": duration,
+        "failures": failures,
+        "collected": collected
+    }
+
+async def run_test_cases(cases: List[TestCase], sink: Optional[BinaryIO] = None) -> List[Dict[str, Any]]:
+    """Run test cases concurrently, returning results in input order.
+    
+    If `sink` is given, each result is appended to it as a JSON line as soon
+    as its case finishes, so partial progress survives an interrupted run.
+    """
+    from unittest.mock import patch
+    from src.nodes import set_config
+    
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    results_by_id: Dict[str, Dict[str, Any]] = {}
+    
+    async def run_and_record(case: TestCase) -> None:
+        # Each case runs in its own task, so this config is local to the case
+        set_config(_CFG_BY_MODE[case.mode])
+        try:
+            result = await arun_test_case(case, semaphore)
+        except Exception as e:
+            print(f"❌ Error running {case.id}: {e}")
+            result = {
+                "id": case.id,
+                "passed": False,
+                "duration": 0,
+                "failures": [str(e)],
+                "collected": {}
+            }
+        results_by_id[case.id] = result
+        if sink is not None:
+            sink.write(orjson.dumps(result, default=str) + b"\n")
+            sink.flush()
+    
+    with patch('src.modes.get_llm') as mock_get_llm:
+        mock_get_llm.return_value = create_mock_llm()
         
-        # Verify results
-        collected = current_state.values.get("collected_fields", {})
-        passed = True
-        failures = []
-        
-        for field_id, expected in test_case.expected_values.items():
-            actual = collected.get(field_id, {}).get("value")
-            match = str(actual) == str(expected)
-            if not match:
-                passed = False
-                failures.append(f"{field_id}: Expected '{expected}', Got '{actual}'")
-        
-        status = "PASSED" if passed else "FAILED"
-        print(f"  Status: {status} ({duration:.2f}s)")
-        if not passed:
-            for f in failures:
-                print(f"    ❌ {f}")
-                
-        return {
-            "id": test_case.id,
-            "passed": passed,
-            "duration": duration,
-            "failures": failures,
-            "collected": collected
-        }
+        await asyncio.gather(*[run_and_record(case) for case in cases])
+    
+    return [results_by_id[case.id] for case in cases]
 
 def compare_results(current: List[Dict], previous: List[Dict]):
     print("\n=== Regression Report ===")
@@ -194,34 +303,21 @@ def compare_results(current: List[Dict], previous: List[Dict]):
 def main():
     parser = argparse.ArgumentParser(description="Run intake form agent evaluations")
     parser.add_argument("--mode", choices=["speed", "quality", "hybrid", "all"], default="all", help="Test mode filter")
-    parser.add_argument("--save", action="store_true", help="Save results to eval_results.json")
+    parser.add_argument("--save", action="store_true", help="Save results to eval_results.json (and per case to eval_results.jsonl)")
     parser.add_argument("--diff", action="store_true", help="Compare with previous results")
     args = parser.parse_args()
     
     # Load cases
     cases_path = Path(__file__).parent / "data" / "eval_cases.json"
-    cases = load_test_cases(str(cases_path))
-    
-    # Filter cases
-    if args.mode != "all":
-        cases = [c for c in cases if c.mode == args.mode]
+    cases = load_test_cases(str(cases_path), mode_filter=args.mode)
     
     print(f"Running {len(cases)} test cases...")
-    results = []
-    
-    for case in cases:
-        try:
-            result = run_test_case(case)
-            results.append(result)
-        except Exception as e:
-            print(f"❌ Error running {case.id}: {e}")
-            results.append({
-                "id": case.id,
-                "passed": False,
-                "duration": 0,
-                "failures": [str(e)],
-                "collected": {}
-            })
+    if args.save:
+        # Per-case results stream to the sidecar as cases finish
+        with open("eval_results.jsonl", "wb") as sink:
+            results = asyncio.run(run_test_cases(cases, sink))
+    else:
+        results = asyncio.run(run_test_cases(cases))
             
     # Summary
     passed_count = sum(1 for r in results if r["passed"])
@@ -231,16 +327,16 @@ def main():
     if args.diff:
         results_path = Path("eval_results.json")
         if results_path.exists():
-            with open(results_path, "r") as f:
-                prev_results = json.load(f)
+            with open(results_path, "rb") as f:
+                prev_results = orjson.loads(f.read())
             compare_results(results, prev_results)
         else:
             print("\n⚠️  No previous results found for diff.")
             
     # Save
     if args.save:
-        with open("eval_results.json", "w") as f:
-            json.dump(results, f, indent=2, default=str)
+        with open("eval_results.json", "wb") as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2, default=str))
         print("\nResults saved to eval_results.json")
         
     if passed_count < len(results):
@@ -13,12 +13,29 @@ Then run this script:
 """
 
 import requests
-import json
+import orjson
 from typing import Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 API_BASE_URL = "http://localhost:8000"
 
+# (connect, read) timeouts in seconds
+REQUEST_TIMEOUT = (3.05, 30)
+
+# Reuse one keep-alive connection pool for every call instead of paying a
+# fresh TCP handshake per turn.
+SESSION = requests.Session()
+SESSION.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.1),
+    ),
+)
+
 
 def start_form(form_id: str, mode: str = "hybrid") -> Optional[str]:
     """Start a new form session and return session_id."""
@@ -26,17 +43,17 @@ def start_form(form_id: str, mode: str = "hybrid") -> Optional[str]:
     payload = {"form_id": form_id, "mode": mode}
     
     print(f"\n📋 Starting form: {form_id} (mode: {mode})")
-    response = requests.post(url, json=payload)
+    response = SESSION.post(url, json=payload, timeout=REQUEST_TIMEOUT)
     
     if response.status_code == 200:
-        data = response.json()
+        data = orjson.loads(response.content)
         session_id = data["session_id"]
         question = data["question"]
         print(f"✅ Session created: {session_id}")
         print(f"\n🤖 Agent: {question}\n")
         return session_id
     else:
-        print(f"❌ Error: {response.status_code} - {response.json()}")
+        print(f"❌ Error: {response.status_code} - {orjson.loads(response.content)}")
         return None
 
 
@@ -45,25 +62,55 @@ def submit_answer(session_id: str, message: str) -> dict:
     url = f"{API_BASE_URL}/api/forms/answer"
     payload = {"session_id": session_id, "message": message}
     
-    response = requests.post(url, json=payload)
+    response = SESSION.post(url, json=payload, timeout=REQUEST_TIMEOUT)
     
     if response.status_code == 200:
-        return response.json()
+        return orjson.loads(response.content)
     else:
-        print(f"❌ Error: {response.status_code} - {response.json()}")
+        print(f"❌ Error: {response.status_code} - {orjson.loads(response.content)}")
         return {}
 
 
+def submit_answer_stream(session_id: str, message: str) -> dict:
+    """Submit an answer, printing progress as the server streams it.
+
+    Returns the final `done` payload (same shape as `submit_answer`).
+    """
+    url = f"{API_BASE_URL}/api/forms/answer/stream"
+    payload = {"session_id": session_id, "message": message}
+    
+    with SESSION.post(url, json=payload, timeout=REQUEST_TIMEOUT, stream=True) as response:
+        if response.status_code != 200:
+            print(f"❌ Error: {response.status_code} - {orjson.loads(response.content)}")
+            return {}
+        
+        result = {}
+        event = None
+        for line in response.iter_lines(decode_unicode=True):
+            if line.startswith("event: "):
+                event = line[len("event: "):]
+            elif line.startswith("data: "):
+                data = orjson.loads(line[len("data: "):])
+                if event == "field":
+                    print(f"   ✓ {data['field_id']}: {data['value']}")
+                elif event == "question":
+                    result["question"] = data["question"]
+                    print(f"\n🤖 Agent: {data['question']}\n")
+                elif event == "done":
+                    result.update(data)
+        return result
+
+
 def get_result(session_id: str) -> dict:
     """Get the final collected form data."""
     url = f"{API_BASE_URL}/api/forms/result/{session_id}"
     
-    response = requests.get(url)
+    response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
     
     if response.status_code == 200:
-        return response.json()
+        return orjson.loads(response.content)
     else:
-        print(f"❌ Error: {response.status_code} - {response.json()}")
+        print(f"❌ Error: {response.status_code} - {orjson.loads(response.content)}")
         return {}
 
 
@@ -71,10 +118,10 @@ def list_forms() -> list:
     """List all available forms."""
     url = f"{API_BASE_URL}/api/forms/list"
     
-    response = requests.get(url)
+    response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
     
     if response.status_code == 200:
-        data = response.json()
+        data = orjson.loads(response.content)
         return data.get("forms", [])
     else:
         print(f"❌ Error: {response.status_code}")
@@ -100,8 +147,8 @@ def interactive_form_filling(form_id: str, mode: str = "hybrid"):
                 print("\n👋 Ending session...")
                 break
             
-            # Submit answer
-            result = submit_answer(session_id, user_input)
+            # Submit answer (questions are printed as they stream in)
+            result = submit_answer_stream(session_id, user_input)
             
             if result.get("is_complete"):
                 print("\n✅ Form Complete!")
@@ -118,22 +165,18 @@ def interactive_form_filling(form_id: str, mode: str = "hybrid"):
                 full_result = get_result(session_id)
                 if full_result:
                     print("\n📊 Full Result:")
-                    print(json.dumps(full_result, indent=2))
+                    print(orjson.dumps(full_result, option=orjson.OPT_INDENT_2).decode())
                 
                 break
-            else:
-                question = result.get("question")
-                if question:
-                    print(f"\n🤖 Agent: {question}\n")
-                else:
-                    print("\n⚠️  No question returned, but form is not complete.")
+            elif not result.get("question"):
+                print("\n⚠️  No question returned, but form is not complete.")
         
         except KeyboardInterrupt:
             print("\n\n👋 Interrupted by user. Getting current result...")
             result = get_result(session_id)
             if result:
                 print("\n📊 Current Progress:")
-                print(json.dumps(result, indent=2))
+                print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
             break
         except Exception as e:
             print(f"\n❌ Error: {e}")
@@ -148,7 +191,7 @@ def main():
     
     # Check if API is running
     try:
-        response = requests.get(f"{API_BASE_URL}/health", timeout=2)
+        response = SESSION.get(f"{API_BASE_URL}/health", timeout=2)
         if response.status_code != 200:
             print(f"❌ API server is not responding at {API_BASE_URL}")
             print("   Please start the server first:")
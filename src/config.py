@@ -1,10 +1,10 @@
 """Configuration for the Intake Form Agent."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Literal, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentConfig:
     """Configuration for the intake form agent."""
     
@@ -14,26 +14,7 @@ class AgentConfig:
     # Hybrid mode thresholds
     confidence_threshold: float = 0.7  # Below this, use LLM
     complex_response_length: int = 100  # Above this, use LLM for annotation
-    complex_field_types: list = field(default_factory=lambda: ["address", "text"])
-    
-    # Reliability settings
-"""Configuration for the Intake Form Agent."""
-
-from dataclasses import dataclass, field
-from typing import Literal, Optional
-
-
-@dataclass
-class AgentConfig:
-    """Configuration for the intake form agent."""
-    
-    # Mode selection
-    default_mode: Literal["speed", "quality", "hybrid"] = "hybrid"
-    
-    # Hybrid mode thresholds
-    confidence_threshold: float = 0.7  # Below this, use LLM
-    complex_response_length: int = 100  # Above this, use LLM for annotation
-    complex_field_types: list = field(default_factory=lambda: ["address", "text"])
+    complex_field_types: frozenset = frozenset({"address", "text"})
     
     # Reliability settings
     max_clarification_attempts: int = 3
@@ -46,4 +27,18 @@ class AgentConfig:
     llm_temperature: float = 0.3    # Lower for consistency
     llm_provider: Literal["google", "openai"] = "google"  # API provider
     google_api_key: Optional[str] = None  # Will use GOOGLE_API_KEY env var if None
-
+    warm_up_ping: bool = True  # Send a throwaway request at startup to open the connection
+    
+    # Generate the next LLM question while the current answer is validated
+    prefetch_questions: bool = True
+    
+    # Response cache (in memory only, if not enabled, when llm_temperature <= 0)
+    cache_enabled: bool = False  # Also reuses extractions of repeated answers
+    cache_backend: Literal["sqlite", "memory", "redis"] = "sqlite"
+    cache_dir: str = ".llm_cache"
+    cache_redis_url: str = "redis://localhost:6379/0"
+    cache_ttl_seconds: float = 3600
+    
+    def __post_init__(self):
+        # Any iterable is accepted; stored as a frozenset for O(1) membership
+        object.__setattr__(self, "complex_field_types", frozenset(self.complex_field_types))
@@ -0,0 +1,18 @@
+"""Lazy, memoized access to environment variables (with .env support)."""
+
+import os
+from functools import lru_cache
+from typing import Optional
+
+
+@lru_cache(maxsize=1)
+def load() -> None:
+    """Load `.env` into the environment, once per process."""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+def get(key: str, default: Optional[str] = None) -> Optional[str]:
+    """Get an environment variable, loading `.env` on first access."""
+    load()
+    return os.environ.get(key, default)
@@ -1,14 +1,23 @@
 """LangGraph definition for the intake form agent."""
 
+from functools import lru_cache
+
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph, END
 
 from src.types import FormState
+from src.modes import precompute_prompt_fragments
 from src.nodes import (
     ask_node,
+    aask_node,
     process_node,
+    aprocess_node,
     validate_node,
+    avalidate_node,
     clarify_node,
+    aclarify_node,
     annotate_node,
+    aannotate_node,
     advance_node,
     output_node,
     route_validation,
@@ -16,16 +25,31 @@ from src.nodes import (
 )
 
 
-def create_intake_graph(checkpointer=None):
-    """Create and compile the intake form LangGraph."""
+def create_intake_graph(checkpointer=None, form_schema=None):
+    """Create and compile the intake form LangGraph.
+    
+    The graph is compiled once per process; each call returns a copy bound
+    to `checkpointer`. If `form_schema` is given, its per-field prompt
+    fragments are rendered up front instead of on the first turn that
+    needs them.
+    """
+    if form_schema is not None:
+        precompute_prompt_fragments(form_schema)
+    
+    return _compile_graph().copy(update={"checkpointer": checkpointer})
+
+
+@lru_cache(maxsize=1)
+def _compile_graph():
+    """Build and compile the graph without a checkpointer."""
     graph = StateGraph(FormState)
     
-    # Add nodes
-    graph.add_node("ask", ask_node)
-    graph.add_node("process", process_node)
-    graph.add_node("validate", validate_node)
-    graph.add_node("clarify", clarify_node)
-    graph.add_node("annotate", annotate_node)
+    # Add nodes (LLM-backed nodes also get async variants, used by astream/ainvoke)
+    graph.add_node("ask", RunnableLambda(ask_node, afunc=aask_node))
+    graph.add_node("process", RunnableLambda(process_node, afunc=aprocess_node))
+    graph.add_node("validate", RunnableLambda(validate_node, afunc=avalidate_node))
+    graph.add_node("clarify", RunnableLambda(clarify_node, afunc=aclarify_node))
+    graph.add_node("annotate", RunnableLambda(annotate_node, afunc=aannotate_node))
     graph.add_node("advance", advance_node)
     graph.add_node("output", output_node)
     
@@ -58,8 +82,5 @@ def create_intake_graph(checkpointer=None):
     
     graph.add_edge("output", END)
     
-    return graph.compile(
-        checkpointer=checkpointer,
-        interrupt_before=["process"]
-    )
+    return graph.compile(interrupt_before=["process"])
 
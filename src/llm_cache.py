@@ -0,0 +1,211 @@
+"""Exact-match cache for LLM responses with pluggable storage backends."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, List, Optional, Protocol, Sequence, Tuple
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    redis = None
+
+
+def _expiry(ttl: Optional[float]) -> Optional[float]:
+    """Absolute expiry timestamp for a ttl (0/None means never)."""
+    return time.time() + ttl if ttl else None
+
+
+class CacheBackend(Protocol):
+    """Storage for cached responses."""
+
+    def get(self, key: str) -> Optional[str]: ...
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class MemoryBackend:
+    """In-process LRU storage."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[str, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._entries[key] = (value, _expiry(ttl))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def close(self) -> None:
+        pass
+
+
+class SQLiteBackend:
+    """On-disk storage, so cached responses survive process restarts."""
+
+    def __init__(self, directory: str = ".llm_cache"):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.directory / "cache.db", check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL
+            )
+        """)
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        value, expires_at = row
+        if expires_at is not None and expires_at < time.time():
+            return None
+        return value
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, _expiry(ttl))
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class RedisBackend:
+    """Shared storage in Redis (requires the `redis` package)."""
+
+    def __init__(self, url: str = "redis://localhost:6379/0", prefix: str = "llm_cache:"):
+        if not REDIS_AVAILABLE:
+            raise ImportError(
+                "redis is required for the Redis cache backend. "
+                "Install with: pip install redis"
+            )
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url, decode_responses=True)
+
+    def get(self, key: str) -> Optional[str]:
+        return self._client.get(self.prefix + key)
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        if ttl is not None and ttl < 0:
+            return  # Already expired
+        self._client.set(self.prefix + key, value, px=int(ttl * 1000) if ttl else None)
+
+    def clear(self) -> None:
+        for key in self._client.scan_iter(match=self.prefix + "*"):
+            self._client.delete(key)
+
+    def close(self) -> None:
+        self._client.close()
+
+
+class LLMCache:
+    """Cache LLM responses, keyed by model, messages and temperature.
+
+    Lookups go through an in-process LRU first, then the backing store
+    (SQLite under `directory` unless another backend is given).
+    """
+
+    def __init__(
+        self,
+        directory: str = ".llm_cache",
+        ttl_seconds: Optional[float] = 3600,
+        backend: Optional[CacheBackend] = None,
+        memory_size: int = 1024
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.backend = backend if backend is not None else SQLiteBackend(directory)
+        self._memory = MemoryBackend(memory_size)
+
+    @staticmethod
+    def cache_key(
+        model: str,
+        messages: Sequence[Tuple[str, Any]],
+        temperature: float,
+        tools: Optional[List[Any]] = None
+    ) -> str:
+        """Build a stable cache key from (role, content) message pairs."""
+        payload = json.dumps(
+            {
+                "model": model,
+                "messages": [list(m) for m in messages],
+                "temp": temperature,
+                "tools": tools,
+            },
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response, or None if missing or expired."""
+        value = self._memory.get(key)
+        if value is None:
+            value = self.backend.get(key)
+            if value is not None:
+                self._memory.set(key, value, self.ttl_seconds)
+        return value
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """Store a response. `ttl` overrides the default expiry (seconds)."""
+        ttl = self.ttl_seconds if ttl is None else ttl
+        self._memory.set(key, value, ttl)
+        self.backend.set(key, value, ttl)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._memory.clear()
+        self.backend.clear()
+
+    def close(self) -> None:
+        """Release the backing store."""
+        self.backend.close()
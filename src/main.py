@@ -2,6 +2,7 @@
 
 import os
 import sys
+import asyncio
 from pathlib import Path
 
 # Add project root to path if running from src directory
@@ -10,15 +11,9 @@ if Path(__file__).parent.name == "src":
     if str(project_root) not in sys.path:
         sys.path.insert(0, str(project_root))
 
-from dotenv import load_dotenv
-from langchain_core.messages import HumanMessage
-from src.graph import create_intake_graph
-from src.nodes import set_config
+from src import env
 from src.config import AgentConfig
 
-# Load environment variables
-load_dotenv()
-
 
 def create_sample_schema():
     """Create a sample form schema for testing."""
@@ -60,9 +55,17 @@ def create_sample_schema():
     }
 
 
-def run_interactive_demo():
+async def run_interactive_demo():
     """Run an interactive demo of the intake form agent."""
-    # Load configuration
+    # Deferred so that `--help` does not pay for loading langchain/langgraph
+    from langchain_core.messages import HumanMessage
+    from src.graph import create_intake_graph
+    from src.nodes import set_config
+    from src.modes import awarm_up_llm
+    from src.utils import ainput
+    
+    # Load configuration (environment variables, including .env)
+    env.load()
     # Available Gemini models: gemini-2.5-pro (tested and works!), gemini-1.5-pro, gemini-1.5-flash
     config = AgentConfig(
         default_mode=os.getenv("DEFAULT_MODE", "hybrid"),
@@ -78,10 +81,10 @@ def run_interactive_demo():
     checkpointer = MemorySaver()
     
     # Create graph with checkpointer
-    graph = create_intake_graph(checkpointer=checkpointer)
+    schema = create_sample_schema()
+    graph = create_intake_graph(checkpointer=checkpointer, form_schema=schema)
     
     # Initialize state
-    schema = create_sample_schema()
     initial_state = {
         "messages": [],
         "form_schema": schema,
@@ -91,7 +94,8 @@ def run_interactive_demo():
         "clarification_count": 0,
         "is_complete": False,
         "notes": [],
-        "mode": config.default_mode
+        "mode": config.default_mode,
+        "last_ai_message_idx": None
     }
     
     print("=" * 60)
@@ -105,15 +109,19 @@ def run_interactive_demo():
     config_run = {"configurable": {"thread_id": thread_id}}
     
     # Start the graph
-    # We use stream to get updates, but we could also use invoke
-    # Since we have an interrupt, invoke will stop at the interrupt
+    # We use invoke rather than draining stream: with the interrupt, invoke
+    # stops at the same point without materializing per-node events
+    
+    # Build the LLM client and open its connection in the background, while
+    # the first question is generated and the user types
+    warmup = asyncio.create_task(awarm_up_llm(config))
     
-    # First run to get to the first question
-    for event in graph.stream(initial_state, config_run):
-        pass
+    # First run to get to the first question. durability="exit" checkpoints
+    # once per run (at the interrupt) instead of after every node.
+    await graph.ainvoke(initial_state, config_run, durability="exit")
         
     # Get the current state
-    current_state = graph.get_state(config_run)
+    current_state = await graph.aget_state(config_run)
     
     while True:
         # Check if we are done
@@ -127,24 +135,15 @@ def run_interactive_demo():
 
         # Get the last message (the question)
         messages = current_state.values.get("messages", [])
-        last_message = None
-        for msg in reversed(messages):
-            if hasattr(msg, "type") and msg.type == "ai":
-                last_message = msg
-                break
-            elif isinstance(msg, dict) and msg.get("type") == "ai":
-                last_message = msg
-                break
-        
-        if last_message:
-            content = last_message.content if hasattr(last_message, "content") else last_message.get("content", "")
-            print(f"Agent: {content}")
+        idx = current_state.values.get("last_ai_message_idx")
+        if idx is not None:
+            print(f"Agent: {messages[idx].content}")
         
         # Get user input
-        try:
-            user_input = input("\nYou: ").strip()
-        except EOFError:
+        user_input = await ainput("\nYou: ")
+        if user_input is None:
             break
+        user_input = user_input.strip()
             
         if not user_input:
             continue
@@ -159,24 +158,25 @@ def run_interactive_demo():
         
         # Resume the graph
         # We update the state with the new message
-        graph.update_state(
+        await graph.aupdate_state(
             config_run,
             {"messages": [HumanMessage(content=user_input)]},
         )
         
         # Continue execution
-        for event in graph.stream(None, config_run):
-            pass
+        await graph.ainvoke(None, config_run, durability="exit")
             
         # Update current state for next iteration
-        current_state = graph.get_state(config_run)
+        current_state = await graph.aget_state(config_run)
+    
+    warmup.cancel()  # No-op unless the session ended before it finished
     
     # Display results
     print("\n" + "=" * 60)
     print("Form Complete!")
     print("=" * 60)
     print("\nCollected Data:")
-    final_state = graph.get_state(config_run).values
+    final_state = (await graph.aget_state(config_run)).values
     collected_fields = final_state.get("collected_fields", {})
     
     for field_id, data in collected_fields.items():
@@ -204,6 +204,7 @@ def run_interactive_demo():
     # Append to CSV
     csv_handler = CSVOutputHandler()
     csv_path = csv_handler.save(collected_fields)
+    csv_handler.close()
     print(f"✅ Appended to CSV: {csv_path}")
     
     print("\n" + "=" * 60)
@@ -218,5 +219,5 @@ if __name__ == "__main__":
     if args.mode:
         os.environ["DEFAULT_MODE"] = args.mode
         
-    run_interactive_demo()
+    asyncio.run(run_interactive_demo())
 
@@ -6,18 +6,21 @@ Example usage:
 """
 
 import argparse
+import asyncio
 
-from dotenv import load_dotenv
-from langchain_core.messages import HumanMessage
+from src import env
 
-from src.v2.session import create_session
 
-# Load environment variables (including GOOGLE_API_KEY) from .env if present
-load_dotenv()
-
-
-def run_cli(form_id: str, mode: str) -> None:
+async def run_cli(form_id: str, mode: str) -> None:
     """Run an interactive CLI session for a given form."""
+    # Deferred so that `--help` does not pay for loading langchain/langgraph
+    from langchain_core.messages import HumanMessage
+    from src.modes import awarm_up_llm
+    from src.utils import ainput
+    from src.v2.session import create_session
+
+    # Load environment variables (including GOOGLE_API_KEY) from .env if present
+    env.load()
     session = create_session(form_id=form_id, mode=mode)
     graph = session["graph"]
     state = session["state"]
@@ -30,11 +33,14 @@ def run_cli(form_id: str, mode: str) -> None:
 
     config_run = {"configurable": {"thread_id": f"v2_cli_{form_id}"}}
 
-    # First run to get to the first question
-    for _ in graph.stream(state, config_run):
-        pass
+    # Build the LLM client and open its connection in the background, while
+    # the first question is generated and the user types
+    warmup = asyncio.create_task(awarm_up_llm(session["config"]))
+
+    # First run to get to the first question (checkpointed only at the interrupt)
+    await graph.ainvoke(state, config_run, durability="exit")
 
-    current_state = graph.get_state(config_run)
+    current_state = await graph.aget_state(config_run)
 
     while True:
         if not current_state.next:
@@ -45,21 +51,14 @@ def run_cli(form_id: str, mode: str) -> None:
 
         # Get last AI message (question)
         messages = current_state.values.get("messages", [])
-        last_message = None
-        for msg in reversed(messages):
-            msg_type = getattr(msg, "type", None) or getattr(msg, "role", None) or msg.__dict__.get("type")
-            if msg_type == "ai":
-                last_message = msg
-                break
-
-        if last_message:
-            content = getattr(last_message, "content", "") or getattr(last_message, "text", "")
-            print(f"Agent: {content}")
+        idx = current_state.values.get("last_ai_message_idx")
+        if idx is not None:
+            print(f"Agent: {messages[idx].content}")
 
-        try:
-            user_input = input("\nYou: ").strip()
-        except EOFError:
+        user_input = await ainput("\nYou: ")
+        if user_input is None:
             break
+        user_input = user_input.strip()
 
         if not user_input:
             continue
@@ -68,17 +67,18 @@ def run_cli(form_id: str, mode: str) -> None:
             print("Goodbye!")
             break
 
-        graph.update_state(
+        await graph.aupdate_state(
             config_run,
             {"messages": [HumanMessage(content=user_input)]},
         )
 
-        for _ in graph.stream(None, config_run):
-            pass
+        await graph.ainvoke(None, config_run, durability="exit")
+
+        current_state = await graph.aget_state(config_run)
 
-        current_state = graph.get_state(config_run)
+    warmup.cancel()  # No-op unless the session ended before it finished
 
-    final_state = graph.get_state(config_run).values
+    final_state = (await graph.aget_state(config_run)).values
     collected_fields = final_state.get("collected_fields", {})
 
     print("\n" + "=" * 60)
@@ -108,7 +108,7 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    run_cli(form_id=args.form_id, mode=args.mode)
+    asyncio.run(run_cli(form_id=args.form_id, mode=args.mode))
 
 
 if __name__ == "__main__":
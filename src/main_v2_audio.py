@@ -23,9 +23,15 @@ load_dotenv()
 from src.v2_audio.audio_bridge import AudioBridge
 from src.v2_audio.config import VoiceConfig, AudioIOConfig, get_voice_config_from_env
 from src.v2_audio.audio_utils import AudioCapture, AudioPlayback, list_audio_devices
+from src.utils import ainput
 
 
-async def run_voice_cli(form_id: str, mode: str, voice_config: VoiceConfig):
+async def run_voice_cli(
+    form_id: str,
+    mode: str,
+    voice_config: VoiceConfig,
+    native_sr: bool = False
+):
     """Run interactive voice-based form filling."""
     print("=" * 60)
     print(f"🎤 Voice-Enabled Intake Form Agent - V2 Audio")
@@ -57,10 +63,16 @@ async def run_voice_cli(form_id: str, mode: str, voice_config: VoiceConfig):
     try:
         # Initialize audio I/O if pyaudio is available
         try:
-            audio_playback = AudioPlayback(sample_rate=24000)
+            audio_playback = AudioPlayback(
+                sample_rate=voice_config.output_sample_rate,
+                native_rate=native_sr
+            )
             audio_playback.start()
             
-            audio_capture = AudioCapture(sample_rate=16000)
+            audio_capture = AudioCapture(
+                sample_rate=voice_config.input_sample_rate,
+                native_rate=native_sr
+            )
             audio_capture.start()
             
             print("✅ Audio I/O initialized")
@@ -72,19 +84,13 @@ async def run_voice_cli(form_id: str, mode: str, voice_config: VoiceConfig):
             print(f"⚠️  Audio I/O error: {e}")
             print("   Continuing with text-only mode...")
         
-        # Callback: Play agent audio output
+        # Callback: Play agent audio output (queued; played by a writer thread)
         async def on_audio_output(audio_data: bytes):
             if audio_playback:
-                try:
-                    # Debug: Check if we got audio
-                    if audio_data and len(audio_data) > 0:
-                        print(f"🔊 Playing audio ({len(audio_data)} bytes)...", end="", flush=True)
-                        await audio_playback.play_async(audio_data)
-                        print(" ✅")
-                    else:
-                        print("⚠️  Received empty audio data")
-                except Exception as e:
-                    print(f"\n⚠️  Error playing audio: {e}")
+                if not audio_data:
+                    print("⚠️  Received empty audio data")
+                elif not audio_playback.enqueue(audio_data):
+                    print("\n⚠️  Playback queue full, dropping audio")
             else:
                 print("⚠️  Audio playback not available (pyaudio not installed or failed)")
         
@@ -120,12 +126,12 @@ async def run_voice_cli(form_id: str, mode: str, voice_config: VoiceConfig):
         # The Live API audio is handled separately when questions are asked
         while not bridge.is_complete():
             try:
-                # Get user input (blocking, but that's okay for CLI)
-                loop = asyncio.get_event_loop()
-                user_input = await loop.run_in_executor(
-                    None,
-                    lambda: input("You: ").strip()
-                )
+                # Read on the dedicated stdin thread, off the event loop
+                user_input = await ainput("You: ")
+                if user_input is None:  # EOF
+                    print("\n\n👋 Interrupted by user")
+                    break
+                user_input = user_input.strip()
                 
                 if not user_input:
                     continue
@@ -179,6 +185,7 @@ async def run_voice_cli(form_id: str, mode: str, voice_config: VoiceConfig):
             
             csv_handler = CSVOutputHandler()
             csv_path = csv_handler.save(collected)
+            csv_handler.close()
             print(f"💾 Appended to: {csv_path}")
     
     finally:
@@ -226,6 +233,11 @@ def main():
         action="store_true",
         help="Disable audio I/O (text-only mode)",
     )
+    parser.add_argument(
+        "--native-sr",
+        action="store_true",
+        help="Open audio devices at their native sample rate and resample in-process",
+    )
     
     args = parser.parse_args()
     
@@ -251,7 +263,8 @@ def main():
         asyncio.run(run_voice_cli(
             form_id=args.form_id,
             mode=args.mode,
-            voice_config=voice_config
+            voice_config=voice_config,
+            native_sr=args.native_sr
         ))
     except KeyboardInterrupt:
         print("\n\n👋 Goodbye!")
@@ -1,14 +1,20 @@
 """Mode-specific implementations (Speed vs Quality)."""
 
+import os
 import re
 import json
-from typing import Dict, Any, Optional, Union
+import asyncio
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple, Type
 from dateutil import parser as date_parser
 
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_openai import ChatOpenAI
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.runnables import Runnable
+from pydantic import BaseModel
 
 # Import Google API exceptions for better error handling
 try:
@@ -18,41 +24,217 @@ except ImportError:
 
 from src.utils import summarize_context
 from src.config import AgentConfig
-
-
-# Initialize LLM (lazy loading)
-_llm: Optional[BaseChatModel] = None
+from src.types import AnnotationResult, ExtractionResult, VerificationResult
+from src.llm_cache import LLMCache, MemoryBackend, RedisBackend, SQLiteBackend
+
+
+@lru_cache(maxsize=8)
+def _create_llm(
+    model: str,
+    temperature: float,
+    provider: str,
+    api_key: Optional[str]
+) -> BaseChatModel:
+    """Build an LLM client. Memoized so each (model, temperature) is built once."""
+    if provider == "google":
+        return ChatGoogleGenerativeAI(
+            model=model,
+            temperature=temperature,
+            google_api_key=api_key,
+            max_retries=1  # Reduce retries to fail faster and trigger fallback
+        )
+    return ChatOpenAI(model=model, temperature=temperature)
 
 
 def get_llm(config: AgentConfig) -> BaseChatModel:
-    """Get or create LLM instance."""
-    global _llm
-    if _llm is None:
-        if config.llm_provider == "google":
-            # Use API key from config or environment variable
-            api_key = config.google_api_key
-            if not api_key:
-                import os
-                api_key = os.getenv("GOOGLE_API_KEY")
-            
-            if not api_key:
-                raise ValueError(
-                    "GOOGLE_API_KEY not found. Please set it in environment or config. "
-                    "Get your API key from: https://makersuite.google.com/app/apikey"
-                )
-            
-            _llm = ChatGoogleGenerativeAI(
-                model=config.llm_model,
-                temperature=config.llm_temperature,
-                google_api_key=api_key,
-                max_retries=1  # Reduce retries to fail faster and trigger fallback
+    """Get the (shared) LLM instance for a config, behind the response cache if enabled."""
+    api_key = None
+    if config.llm_provider == "google":
+        # Use API key from config or environment variable
+        api_key = config.google_api_key or os.getenv("GOOGLE_API_KEY")
+        
+        if not api_key:
+            raise ValueError(
+                "GOOGLE_API_KEY not found. Please set it in environment or config. "
+                "Get your API key from: https://makersuite.google.com/app/apikey"
             )
-        else:
-            _llm = ChatOpenAI(
-                model=config.llm_model,
-                temperature=config.llm_temperature
+    
+    llm = _create_llm(
+        config.llm_model,
+        config.llm_temperature,
+        config.llm_provider,
+        api_key
+    )
+    
+    cache = get_llm_cache(config)
+    if cache is not None:
+        return CachedLLM(llm, cache, config.llm_model, config.llm_temperature)
+    return llm
+
+
+# Binding a schema (tool conversion, output parser) is not free, so each
+# (model, schema) pair is bound once. Entries hold their model, so an id is
+# not reused while it is a key.
+_structured_llms: Dict[Tuple[int, type], Tuple[Runnable, Runnable]] = {}
+
+
+def _bind_schema(llm: Runnable, schema: Type[BaseModel]) -> Runnable:
+    """`llm.with_structured_output(schema)`, memoized per model instance."""
+    key = (id(llm), schema)
+    entry = _structured_llms.get(key)
+    if entry is None:
+        if len(_structured_llms) >= 64:
+            _structured_llms.clear()
+        entry = _structured_llms[key] = (llm, llm.with_structured_output(schema))
+    return entry[1]
+
+
+def get_structured_llm(config: AgentConfig, schema: Type[BaseModel]) -> Runnable:
+    """Get the LLM bound to return validated `schema` instances (structured output)."""
+    llm = get_llm(config)
+    if isinstance(llm, CachedLLM):
+        return llm.with_structured_output(schema)
+    return _bind_schema(llm, schema)
+
+
+async def awarm_up_llm(config: AgentConfig) -> None:
+    """Build the LLM client ahead of its first use (e.g. while the user types).
+    
+    With `config.warm_up_ping`, a throwaway request also opens the HTTP/TLS
+    connection, so the first real call does not pay for the handshake.
+    """
+    if config.default_mode == "speed":
+        return
+    try:
+        llm = await asyncio.to_thread(get_llm, config)
+        if config.warm_up_ping:
+            # Bypass the response cache, which would answer a repeat ping locally
+            client = llm.wrapped if isinstance(llm, CachedLLM) else llm
+            await asyncio.wait_for(
+                client.ainvoke([HumanMessage(content="ping")]),
+                config.llm_timeout_seconds
             )
-    return _llm
+    except Exception:
+        pass  # Surfaces again on the first real call
+
+
+@lru_cache(maxsize=8)
+def _llm_cache(backend: str, location: Optional[str], ttl_seconds: Optional[float]) -> LLMCache:
+    """One response cache per (backend, location, TTL)."""
+    if backend == "memory":
+        cache_backend = MemoryBackend()
+    elif backend == "redis":
+        cache_backend = RedisBackend(location)
+    else:
+        cache_backend = SQLiteBackend(location)
+    return LLMCache(ttl_seconds=ttl_seconds, backend=cache_backend)
+
+
+def get_llm_cache(config: AgentConfig) -> Optional[LLMCache]:
+    """Get the response cache, or None if caching is off for this config.
+    
+    Deterministic configs (llm_temperature <= 0) get an in-memory cache even
+    without `cache_enabled`; prompts (and the answers in them) are only
+    persisted to `cache_backend` when caching is explicitly enabled.
+    Configs that name the same backend, location and TTL share a cache.
+    """
+    if not config.cache_enabled:
+        if config.llm_temperature > 0:
+            return None
+        return _llm_cache("memory", None, config.cache_ttl_seconds)
+    if config.cache_backend == "memory":
+        location = None
+    elif config.cache_backend == "redis":
+        location = config.cache_redis_url
+    else:
+        location = config.cache_dir
+    return _llm_cache(config.cache_backend, location, config.cache_ttl_seconds)
+
+
+@lru_cache(maxsize=16)
+def _schema_tool(schema: Type[BaseModel]) -> Dict[str, Any]:
+    """JSON schema of a structured output, part of its cache key."""
+    return schema.model_json_schema()
+
+
+class CachedLLM:
+    """Proxy that serves repeat `invoke`/`ainvoke` calls from an `LLMCache`.
+
+    Everything else is delegated to the wrapped model. With a `schema`, the
+    wrapped runnable returns `schema` instances, which are cached as JSON.
+    """
+    
+    def __init__(
+        self,
+        llm: Runnable,
+        cache: LLMCache,
+        model: str,
+        temperature: float,
+        schema: Optional[Type[BaseModel]] = None
+    ):
+        self._llm = llm
+        self._cache = cache
+        self._model = model
+        self._temperature = temperature
+        self._schema = schema
+        self._tools = [_schema_tool(schema)] if schema is not None else None
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._llm, name)
+    
+    @property
+    def wrapped(self) -> Runnable:
+        """The underlying model, for calls that should not be cached."""
+        return self._llm
+    
+    def with_structured_output(self, schema: Type[BaseModel], **kwargs: Any) -> "CachedLLM":
+        return CachedLLM(
+            self._llm.with_structured_output(schema, **kwargs) if kwargs else _bind_schema(self._llm, schema),
+            self._cache,
+            self._model,
+            self._temperature,
+            schema
+        )
+    
+    def _key(self, messages: List[BaseMessage]) -> str:
+        return LLMCache.cache_key(
+            self._model,
+            [(m.type, m.content) for m in messages],
+            self._temperature,
+            self._tools
+        )
+    
+    def _load(self, cached: str) -> Any:
+        if self._schema is not None:
+            return self._schema.model_validate_json(cached)
+        return AIMessage(content=cached)
+    
+    def _store(self, key: str, response: Any) -> None:
+        if self._schema is not None:
+            if isinstance(response, self._schema):
+                self._cache.set(key, response.model_dump_json())
+        elif isinstance(response.content, str):
+            self._cache.set(key, response.content)
+    
+    def invoke(self, messages: List[BaseMessage], **kwargs: Any) -> Any:
+        key = self._key(messages)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return self._load(cached)
+        
+        response = self._llm.invoke(messages, **kwargs)
+        self._store(key, response)
+        return response
+    
+    async def ainvoke(self, messages: List[BaseMessage], **kwargs: Any) -> Any:
+        key = self._key(messages)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return self._load(cached)
+        
+        response = await self._llm.ainvoke(messages, **kwargs)
+        self._store(key, response)
+        return response
 
 
 # ==================== ASK NODE ====================
@@ -76,44 +258,98 @@ def format_options(options: list) -> str:
     return "\n".join(f"- {opt}" for opt in options)
 
 
-def ask_speed(field: Dict[str, Any], context: Dict[str, Any]) -> str:
-    """Speed mode: Template-based question generation."""
-    template = QUESTION_TEMPLATES.get(
-        field.get("field_type", "text"),
-        "What is your {label}?"
-    )
-    
+@lru_cache(maxsize=512)
+def _speed_question(field_type: str, label: str, description: str, options: tuple) -> str:
+    """Render a template question; the result depends only on the field."""
+    template = QUESTION_TEMPLATES.get(field_type, "What is your {label}?")
     return template.format(
-        label=field.get("label", ""),
-        description=field.get("description", ""),
-        options=format_options(field.get("options", []))
+        label=label,
+        description=description,
+        options=format_options(list(options))
     )
 
 
-def ask_quality(field: Dict[str, Any], context: Dict[str, Any], config: AgentConfig) -> str:
-    """Quality mode: LLM-generated contextual question."""
-    try:
-        llm = get_llm(config)
-        
-        prompt = f"""Generate a natural, conversational question to collect:
+def _speed_question_key(field: Dict[str, Any]) -> tuple:
+    """Arguments of `_speed_question` for a field."""
+    return (
+        field.get("field_type", "text"),
+        field.get("label", ""),
+        field.get("description", ""),
+        tuple(field.get("options", []))
+    )
 
-Field: {field.get('label', '')}
-Type: {field.get('field_type', 'text')}
-Description: {field.get('description', 'N/A')}
-Options: {field.get('options', 'N/A')}
 
-Previous responses: {summarize_context(context)}
+def ask_speed(field: Dict[str, Any], context: Dict[str, Any]) -> str:
+    """Speed mode: Template-based question generation."""
+    return _speed_question(*_speed_question_key(field))
+
+
+ASK_SYSTEM = SystemMessage(content="""Generate a natural, conversational question to collect an intake form field.
 
 Requirements:
 - Sound natural and friendly
 - Include format hints if helpful
 - Reference previous answers if relevant
-- Keep it concise (1-2 sentences)
+- Keep it concise (1-2 sentences)""")
 
-Question:"""
-        
-        response = llm.invoke([HumanMessage(content=prompt)])
-        return response.content
+
+def _field_key(field: Dict[str, Any]) -> tuple:
+    """Hashable summary of the field attributes that appear in prompts."""
+    options = field.get('options', 'N/A')
+    return (
+        field.get('label', ''),
+        field.get('field_type', 'text'),
+        field.get('description', 'N/A'),
+        tuple(options) if isinstance(options, list) else options
+    )
+
+
+@lru_cache(maxsize=512)
+def _ask_header(label: str, field_type: str, description: str, options: Any) -> str:
+    """Render the static, per-field part of the question prompt."""
+    if isinstance(options, tuple):
+        options = list(options)
+    return f"""Field: {label}
+Type: {field_type}
+Description: {description}
+Options: {options}"""
+
+
+@lru_cache(maxsize=512)
+def _extract_header(label: str, field_type: str, description: str, options: Any) -> str:
+    """Render the static, per-field part of the extraction prompt."""
+    if isinstance(options, tuple):
+        options = list(options)
+    return f"""Field: {label}
+Type: {field_type}
+Options: {options}"""
+
+
+def precompute_prompt_fragments(form_schema: Dict[str, Any]) -> None:
+    """Render the per-field questions and prompt fragments for every field up front."""
+    for field in form_schema.get("fields", []):
+        _speed_question(*_speed_question_key(field))
+        if field.get("field_type") == "select":
+            _select_index(tuple(field.get("options", [])))
+        key = _field_key(field)
+        _ask_header(*key)
+        _extract_header(*key)
+
+
+def _ask_messages(field: Dict[str, Any], context: Dict[str, Any]) -> List[BaseMessage]:
+    """Build the question-generation messages (static system prefix, dynamic tail)."""
+    return [ASK_SYSTEM, HumanMessage(content=f"""{_ask_header(*_field_key(field))}
+
+Previous responses: {summarize_context(context)}
+
+Question:""")]
+
+
+def ask_quality(field: Dict[str, Any], context: Dict[str, Any], config: AgentConfig) -> str:
+    """Quality mode: LLM-generated contextual question."""
+    try:
+        llm = get_llm(config)
+        return llm.invoke(_ask_messages(field, context)).content
     except (Exception, KeyboardInterrupt) as e:
         # Fallback to speed mode on any error (including model not found, API errors, etc.)
         print(f"\n⚠️  LLM Error in ask_quality: {type(e).__name__}: {e}")
@@ -122,24 +358,62 @@ Question:"""
         raise
 
 
+async def aask_quality(field: Dict[str, Any], context: Dict[str, Any], config: AgentConfig) -> str:
+    """Async version of `ask_quality`."""
+    try:
+        llm = get_llm(config)
+        return (await llm.ainvoke(_ask_messages(field, context))).content
+    except (Exception, KeyboardInterrupt) as e:
+        print(f"\n⚠️  LLM Error in aask_quality: {type(e).__name__}: {e}")
+        if config.fallback_on_error:
+            return ask_speed(field, context)
+        raise
+
+
 # ==================== PROCESS NODE ====================
 
+_EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+_NON_DIGIT_RE = re.compile(r'\D')
+_NUMBER_RE = re.compile(r'-?\d+\.?\d*')
+
+
 def extract_email(text: str, field: Dict[str, Any]) -> str:
     """Extract email from text."""
-    match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', text)
+    match = _EMAIL_RE.search(text)
     return match.group(0) if match else text.strip()
 
 
 def extract_phone(text: str, field: Dict[str, Any]) -> str:
     """Extract and normalize phone number."""
-    digits = re.sub(r'\D', '', text)
+    digits = _NON_DIGIT_RE.sub('', text)
     if len(digits) == 10:
         return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
     return digits if len(digits) >= 10 else text.strip()
 
 
+# Common formats tried before the general-purpose (and much slower) dateutil parser
+_DATE_FORMATS = ("%m/%d/%Y", "%m-%d-%Y", "%B %d, %Y")
+
+
+def _parse_date_fast(text: str) -> Optional[date]:
+    """Parse ISO and a few canonical formats; None if none of them match."""
+    try:
+        return date.fromisoformat(text)
+    except ValueError:
+        pass
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
 def extract_date(text: str, field: Dict[str, Any]) -> str:
     """Extract date from text."""
+    parsed = _parse_date_fast(text.strip())
+    if parsed is not None:
+        return parsed.isoformat()
     try:
         parsed = date_parser.parse(text)
         return parsed.strftime("%Y-%m-%d")
@@ -149,7 +423,7 @@ def extract_date(text: str, field: Dict[str, Any]) -> str:
 
 def extract_number(text: str, field: Dict[str, Any]) -> float:
     """Extract number from text."""
-    match = re.search(r'-?\d+\.?\d*', text)
+    match = _NUMBER_RE.search(text)
     if match:
         try:
             return float(match.group(0))
@@ -158,50 +432,72 @@ def extract_number(text: str, field: Dict[str, Any]) -> float:
     raise ValueError("No number found")
 
 
+_BOOL_TRUE = frozenset({"yes", "y", "yeah", "yep", "true", "1", "correct"})
+_BOOL_FALSE = frozenset({"no", "n", "nope", "false", "0", "incorrect"})
+
+
 def extract_boolean(text: str, field: Dict[str, Any]) -> Optional[bool]:
     """Extract boolean from text."""
     text_lower = text.lower().strip()
-    if text_lower in ["yes", "y", "yeah", "yep", "true", "1", "correct"]:
+    if text_lower in _BOOL_TRUE:
         return True
-    if text_lower in ["no", "n", "nope", "false", "0", "incorrect"]:
+    if text_lower in _BOOL_FALSE:
         return False
     return None
 
 
+@lru_cache(maxsize=128)
+def _select_index(options: tuple) -> Tuple[Dict[str, str], Tuple[Tuple[str, str], ...]]:
+    """Lowercased lookups for a select field's options.
+    
+    Returns an exact-match map (first option wins on case collisions) and
+    the (lowercased, option) pairs in order for fuzzy matching.
+    """
+    lowered = tuple((opt.lower(), opt) for opt in options)
+    exact: Dict[str, str] = {}
+    for opt_lower, opt in lowered:
+        exact.setdefault(opt_lower, opt)
+    return exact, lowered
+
+
 def extract_select(text: str, field: Dict[str, Any]) -> str:
     """Extract select option with fuzzy matching."""
-    options = field.get("options", [])
+    exact, lowered = _select_index(tuple(field.get("options", [])))
     text_lower = text.lower().strip()
     
     # Exact match
-    for opt in options:
-        if opt.lower() == text_lower:
-            return opt
+    match = exact.get(text_lower)
+    if match is not None:
+        return match
     
     # Fuzzy match
-    for opt in options:
-        if text_lower in opt.lower() or opt.lower() in text_lower:
+    for opt_lower, opt in lowered:
+        if text_lower in opt_lower or opt_lower in text_lower:
             return opt
     
     return text.strip()
 
 
+def extract_text(text: str, field: Dict[str, Any]) -> str:
+    """Extract free text."""
+    return text.strip()
+
+
+_EXTRACTORS = {
+    "email": extract_email,
+    "phone": extract_phone,
+    "date": extract_date,
+    "number": extract_number,
+    "boolean": extract_boolean,
+    "select": extract_select,
+    "text": extract_text,
+    "address": extract_text,
+}
+
+
 def process_speed(user_input: str, field: Dict[str, Any]) -> Dict[str, Any]:
     """Speed mode: Regex-based extraction."""
-    field_type = field.get("field_type", "text")
-    
-    extractors = {
-        "email": extract_email,
-        "phone": extract_phone,
-        "date": extract_date,
-        "number": extract_number,
-        "boolean": extract_boolean,
-        "select": extract_select,
-        "text": lambda x, f: x.strip(),
-        "address": lambda x, f: x.strip()
-    }
-    
-    extractor = extractors.get(field_type, lambda x, f: x.strip())
+    extractor = _EXTRACTORS.get(field.get("field_type", "text"), extract_text)
     
     try:
         value = extractor(user_input, field)
@@ -221,41 +517,141 @@ def process_speed(user_input: str, field: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
-def process_quality(user_input: str, field: Dict[str, Any], config: AgentConfig) -> Dict[str, Any]:
-    """Quality mode: LLM-based extraction."""
-    try:
-        llm = get_llm(config)
-        
-        prompt = f"""Extract the {field.get('field_type', 'text')} value from this response.
+# Answers that are nothing but a well-formed value need no LLM extraction
+_EXACT_PATTERNS = {
+    "email": _EMAIL_RE,
+    "phone": re.compile(r'\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}'),
+    "number": re.compile(r'-?\d+(?:\.\d+)?'),
+}
 
-Field: {field.get('label', '')}
-Type: {field.get('field_type', 'text')}
-Options: {field.get('options', 'N/A')}
+
+def process_exact(user_input: str, field: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Regex extraction for answers that exactly match their field type.
+    
+    Returns None when the answer needs the LLM.
+    """
+    pattern = _EXACT_PATTERNS.get(field.get("field_type", "text"))
+    if pattern is None or not pattern.fullmatch(user_input.strip()):
+        return None
+    return process_speed(user_input, field)
+
+
+EXTRACT_SYSTEM = SystemMessage(content="""Extract the value of an intake form field from the user's response.
+
+Give the value in the field's type, your confidence (0.0-1.0), and any
+observations about ambiguity or uncertainty.""")
+
+
+def _extract_messages(user_input: str, field: Dict[str, Any]) -> List[BaseMessage]:
+    """Build the value-extraction messages."""
+    return [EXTRACT_SYSTEM, HumanMessage(content=f"""{_extract_header(*_field_key(field))}
 User said: "{user_input}"
+""")]
 
-Return JSON:
-{{
-    "value": <extracted value in correct type>,
-    "confidence": <0.0-1.0>,
-    "notes": [<any observations about ambiguity, uncertainty>]
-}}
 
-JSON:"""
-        
-        response = llm.invoke([HumanMessage(content=prompt)])
-        result = json.loads(response.content)
+def _normalize_answer(user_input: str) -> str:
+    """Case- and whitespace-insensitive form of an answer, minus edge punctuation."""
+    return " ".join(user_input.casefold().split()).strip(".,!?;: ")
+
+
+# With cache_enabled, extractions are reused for repeats of the same answer
+# to the same field. Similar answers are not enough ("Jon" vs "John",
+# "March" vs "May", "yes I am" vs "no I am not"), so the key is the exact
+# field and the normalized answer. Kept in memory only.
+_extractions = MemoryBackend(maxsize=1024)
+
+
+def _extraction_key(user_input: str, field: Dict[str, Any]) -> str:
+    return repr((_field_key(field), _normalize_answer(user_input)))
+
+
+def _cached_extraction(user_input: str, field: Dict[str, Any], config: AgentConfig) -> Optional[Dict[str, Any]]:
+    """Return a cached extraction for the same answer to the same field, if any."""
+    if not config.cache_enabled:
+        return None
+    cached = _extractions.get(_extraction_key(user_input, field))
+    if cached is None:
+        return None
+    return {**json.loads(cached), "raw": user_input, "extraction_method": "cache"}
+
+
+def _store_extraction(user_input: str, field: Dict[str, Any], config: AgentConfig, result: Dict[str, Any]) -> None:
+    """Remember an LLM extraction for repeats of the same answer."""
+    if config.cache_enabled:
+        _extractions.set(_extraction_key(user_input, field), json.dumps(result))
+
+
+def process_quality(user_input: str, field: Dict[str, Any], config: AgentConfig) -> Dict[str, Any]:
+    """Quality mode: LLM-based extraction."""
+    exact = process_exact(user_input, field)
+    if exact is not None:
+        return exact
+    cached = _cached_extraction(user_input, field, config)
+    if cached is not None:
+        return cached
+    
+    try:
+        llm = get_structured_llm(config, ExtractionResult)
+        result = llm.invoke(_extract_messages(user_input, field)).model_dump()
+        _store_extraction(user_input, field, config, result)
         result["raw"] = user_input
         result["extraction_method"] = "llm"
         return result
-    except (Exception, KeyboardInterrupt) as e:
+    except (Exception, KeyboardInterrupt):
         # Fallback to speed mode on any error (including model not found, API errors, etc.)
         if config.fallback_on_error:
             return process_speed(user_input, field)
         raise
 
 
+async def aprocess_quality(user_input: str, field: Dict[str, Any], config: AgentConfig) -> Dict[str, Any]:
+    """Async version of `process_quality`."""
+    exact = process_exact(user_input, field)
+    if exact is not None:
+        return exact
+    cached = _cached_extraction(user_input, field, config)
+    if cached is not None:
+        return cached
+    
+    try:
+        llm = get_structured_llm(config, ExtractionResult)
+        result = (await llm.ainvoke(_extract_messages(user_input, field))).model_dump()
+        _store_extraction(user_input, field, config, result)
+        result["raw"] = user_input
+        result["extraction_method"] = "llm"
+        return result
+    except (Exception, KeyboardInterrupt):
+        if config.fallback_on_error:
+            return process_speed(user_input, field)
+        raise
+
+
 # ==================== VALIDATE NODE ====================
 
+VERIFY_SYSTEM = SystemMessage(content="""Verify this extracted value makes sense.
+
+Does the extracted value accurately represent what the user meant?
+Is there any ambiguity that should be clarified? If so, explain why.""")
+
+
+def _verify_messages(collected: Dict[str, Any], field: Dict[str, Any]) -> List[BaseMessage]:
+    """Build the extracted-value verification messages."""
+    return [VERIFY_SYSTEM, HumanMessage(content=f"""Field: {field.get('label', '')} ({field.get('field_type', 'text')})
+User said: "{collected.get('raw', '')}"
+Extracted: {collected.get('value', '')}
+""")]
+
+
+def _apply_verification(verification: VerificationResult, rule_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn an LLM verification verdict into a validation result."""
+    if not verification.valid or verification.needs_clarification:
+        return {
+            "valid": False,
+            "errors": [verification.reason or "Please clarify your response"]
+        }
+    return rule_result
+
+
 def verify_quality(
     collected: Dict[str, Any],
     field: Dict[str, Any],
@@ -266,61 +662,82 @@ def verify_quality(
     if collected.get("confidence", 1.0) > 0.9:
         return rule_result
     
-    llm = get_llm(config)
+    llm = get_structured_llm(config, VerificationResult)
     
-    prompt = f"""Verify this extracted value makes sense.
-
-Field: {field.get('label', '')} ({field.get('field_type', 'text')})
-User said: "{collected.get('raw', '')}"
-Extracted: {collected.get('value', '')}
-
-Does the extracted value accurately represent what the user meant?
-Is there any ambiguity that should be clarified?
+    try:
+        return _apply_verification(llm.invoke(_verify_messages(collected, field)), rule_result)
+    except Exception:
+        return rule_result  # Fallback to rule result
 
-Return JSON:
-{{
-    "valid": true/false,
-    "needs_clarification": true/false,
-    "reason": "explanation if invalid or ambiguous"
-}}
 
-JSON:"""
+async def averify_quality(
+    collected: Dict[str, Any],
+    field: Dict[str, Any],
+    rule_result: Dict[str, Any],
+    config: AgentConfig
+) -> Dict[str, Any]:
+    """Async version of `verify_quality`."""
+    if collected.get("confidence", 1.0) > 0.9:
+        return rule_result
     
-    try:
-        response = llm.invoke([HumanMessage(content=prompt)])
-        verification = json.loads(response.content)
-        
-        if not verification.get("valid", True) or verification.get("needs_clarification", False):
-            return {
-                "valid": False,
-                "errors": [verification.get("reason", "Please clarify your response")]
-            }
-    except:
-        pass  # Fallback to rule result
+    llm = get_structured_llm(config, VerificationResult)
     
-    return rule_result
+    try:
+        return _apply_verification(await llm.ainvoke(_verify_messages(collected, field)), rule_result)
+    except Exception:
+        return rule_result  # Fallback to rule result
 
 
 # ==================== CLARIFY NODE ====================
 
+# Checked in order; the first key found in an error picks the message
+_CLARIFY_KEYS = ("email", "phone", "date", "required", "select", "number", "default")
+
+_CLARIFY_STATIC = {
+    "email": "Please provide a valid email address (e.g., name@example.com)",
+    "phone": "Please provide your phone number with area code (e.g., 555-123-4567)",
+    "date": "Please provide a valid date (e.g., 01/15/2024 or January 15, 2024)",
+    "number": "Please provide a numeric value",
+}
+
+
 def clarify_speed(field: Dict[str, Any], errors: list, attempt: int) -> str:
     """Speed mode: Template-based clarification."""
-    error_templates = {
-        "email": "Please provide a valid email address (e.g., name@example.com)",
-        "phone": "Please provide your phone number with area code (e.g., 555-123-4567)",
-        "date": "Please provide a valid date (e.g., 01/15/2024 or January 15, 2024)",
-        "required": f"The {field.get('label', 'field')} is required. Please provide a response.",
-        "select": f"Please choose from: {', '.join(field.get('options', []))}",
-        "number": "Please provide a numeric value",
-        "default": f"Please provide a valid {field.get('label', 'value')}"
-    }
-    
-    # Match error to template
-    for key, template in error_templates.items():
-        if any(key in e.lower() for e in errors):
-            return template
+    errors_lower = [e.lower() for e in errors]
+    key = next(
+        (k for k in _CLARIFY_KEYS if any(k in e for e in errors_lower)),
+        "default"
+    )
     
-    return error_templates["default"]
+    # Only the matched message that depends on the field gets rendered
+    if key == "required":
+        return f"The {field.get('label', 'field')} is required. Please provide a response."
+    if key == "select":
+        return f"Please choose from: {', '.join(field.get('options', []))}"
+    if key == "default":
+        return f"Please provide a valid {field.get('label', 'value')}"
+    return _CLARIFY_STATIC[key]
+
+
+CLARIFY_SYSTEM = SystemMessage(content="""Generate a helpful clarification request.
+
+Requirements:
+- Be friendly and helpful, not robotic
+- Explain what's wrong clearly
+- Give a specific example of correct format
+- If attempt > 1, try a different explanation approach
+- Keep it concise""")
+
+
+def _clarify_messages(field: Dict[str, Any], errors: list, collected: Dict[str, Any], attempt: int) -> List[BaseMessage]:
+    """Build the clarification messages."""
+    return [CLARIFY_SYSTEM, HumanMessage(content=f"""Field: {field.get('label', '')}
+Type: {field.get('field_type', 'text')}
+User said: "{collected.get('raw', '')}"
+Validation errors: {errors}
+Attempt: {attempt} of 3
+
+Clarification:""")]
 
 
 def clarify_quality(
@@ -333,28 +750,28 @@ def clarify_quality(
     """Quality mode: LLM-generated clarification."""
     try:
         llm = get_llm(config)
-        
-        prompt = f"""Generate a helpful clarification request.
-
-Field: {field.get('label', '')}
-Type: {field.get('field_type', 'text')}
-User said: "{collected.get('raw', '')}"
-Validation errors: {errors}
-Attempt: {attempt} of 3
+        response = llm.invoke(_clarify_messages(field, errors, collected, attempt))
+        return response.content
+    except (Exception, KeyboardInterrupt):
+        # Fallback to speed mode on any error (including model not found, API errors, etc.)
+        if config.fallback_on_error:
+            return clarify_speed(field, errors, attempt)
+        raise
 
-Requirements:
-- Be friendly and helpful, not robotic
-- Explain what's wrong clearly
-- Give a specific example of correct format
-- If attempt > 1, try a different explanation approach
-- Keep it concise
 
-Clarification:"""
-        
-        response = llm.invoke([HumanMessage(content=prompt)])
+async def aclarify_quality(
+    field: Dict[str, Any],
+    errors: list,
+    collected: Dict[str, Any],
+    attempt: int,
+    config: AgentConfig
+) -> str:
+    """Async version of `clarify_quality`."""
+    try:
+        llm = get_llm(config)
+        response = await llm.ainvoke(_clarify_messages(field, errors, collected, attempt))
         return response.content
-    except (Exception, KeyboardInterrupt) as e:
-        # Fallback to speed mode on any error (including model not found, API errors, etc.)
+    except (Exception, KeyboardInterrupt):
         if config.fallback_on_error:
             return clarify_speed(field, errors, attempt)
         raise
@@ -362,50 +779,49 @@ Clarification:"""
 
 # ==================== ANNOTATE NODE ====================
 
+# (group, pattern, note); patterns are anchored at a word boundary below.
+# Uncertainty groups are listed by priority; only the first one found is noted
+_UNCERTAINTY_PATTERNS = [
+    ("think", r'i think\b', "Response contains uncertainty"),
+    ("maybe", r'maybe\b', "Response contains uncertainty"),
+    ("approx", r'approx', "Approximate value provided"),
+    ("around", r'around\b', "Approximate value provided"),
+    ("not_sure", r'not sure\b', "Respondent expressed uncertainty"),
+]
+_CONTEXT_PATTERNS = [
+    ("conditional", r'(?:if|unless|depending|when)\b', "Response contains conditional language"),
+    ("time_sensitive", r'(?:currently|right now|at the moment|as of)\b', "Response may be time-sensitive"),
+    ("external_ref", r'(?:attached|see |refer to|document)\b', "References external document"),
+]
+
+# All patterns fused into one alternation behind a shared word boundary, so
+# the text is scanned once
+_ANNOTATE_RE = re.compile(r'\b(?:' + "|".join(
+    f"(?P<{group}>{pattern})"
+    for group, pattern, _ in _UNCERTAINTY_PATTERNS + _CONTEXT_PATTERNS
+) + ')')
+
+
 def annotate_speed(raw_response: str) -> list:
     """Speed mode: Pattern-based annotation."""
-    notes = []
-    text = raw_response.lower()
+    found = {match.lastgroup for match in _ANNOTATE_RE.finditer(raw_response.lower())}
+    notes: Dict[str, None] = {}  # Ordered set
     
     # Uncertainty detection
-    uncertainty_patterns = [
-        (r'\bi think\b', "Response contains uncertainty"),
-        (r'\bmaybe\b', "Response contains uncertainty"),
-        (r'\bapprox', "Approximate value provided"),
-        (r'\baround\b', "Approximate value provided"),
-        (r'\bnot sure\b', "Respondent expressed uncertainty"),
-    ]
-    
-    for pattern, note in uncertainty_patterns:
-        if re.search(pattern, text):
-            notes.append(note)
+    for group, _, note in _UNCERTAINTY_PATTERNS:
+        if group in found:
+            notes[note] = None
             break
     
-    # Conditional language
-    if re.search(r'\b(if|unless|depending|when)\b', text):
-        notes.append("Response contains conditional language")
-    
-    # Time-sensitive
-    if re.search(r'\b(currently|right now|at the moment|as of)\b', text):
-        notes.append("Response may be time-sensitive")
-    
-    # External references
-    if re.search(r'\b(attached|see |refer to|document)\b', text):
-        notes.append("References external document")
+    # Conditional language, time-sensitive values, external references
+    for group, _, note in _CONTEXT_PATTERNS:
+        if group in found:
+            notes[note] = None
     
-    return notes
+    return list(notes)
 
 
-def annotate_quality(collected: Dict[str, Any], state: Dict[str, Any], config: AgentConfig) -> list:
-    """Quality mode: LLM-based annotation."""
-    try:
-        llm = get_llm(config)
-        
-        prompt = f"""Analyze this response for any notable observations.
-
-Field: {state.get('current_field_id', 'unknown')}
-User said: "{collected.get('raw', '')}"
-Extracted value: {collected.get('value', '')}
+ANNOTATE_SYSTEM = SystemMessage(content="""Analyze this response for any notable observations.
 
 Flag any of the following if present:
 - Uncertainty or hedging language
@@ -415,18 +831,37 @@ Flag any of the following if present:
 - Potential inconsistencies with previous answers
 - Anything that might need follow-up
 
+Return no notes if nothing is notable.""")
+
+
+def _annotate_messages(collected: Dict[str, Any], state: Dict[str, Any]) -> List[BaseMessage]:
+    """Build the response-annotation messages."""
+    return [ANNOTATE_SYSTEM, HumanMessage(content=f"""Field: {state.get('current_field_id', 'unknown')}
+User said: "{collected.get('raw', '')}"
+Extracted value: {collected.get('value', '')}
+
 Previous answers: {summarize_context(state.get('collected_fields', {}))}
+""")]
 
-Return JSON array of notes (empty if nothing notable):
-["note 1", "note 2"]
 
-Notes:"""
-        
-        response = llm.invoke([HumanMessage(content=prompt)])
-        return json.loads(response.content)
-    except (Exception, KeyboardInterrupt) as e:
+def annotate_quality(collected: Dict[str, Any], state: Dict[str, Any], config: AgentConfig) -> list:
+    """Quality mode: LLM-based annotation."""
+    try:
+        llm = get_structured_llm(config, AnnotationResult)
+        return llm.invoke(_annotate_messages(collected, state)).notes
+    except (Exception, KeyboardInterrupt):
         # Fallback to speed mode on any error (including model not found, API errors, etc.)
         if config.fallback_on_error:
             return annotate_speed(collected.get('raw', ''))
         return []
 
+
+async def aannotate_quality(collected: Dict[str, Any], state: Dict[str, Any], config: AgentConfig) -> list:
+    """Async version of `annotate_quality`."""
+    try:
+        llm = get_structured_llm(config, AnnotationResult)
+        return (await llm.ainvoke(_annotate_messages(collected, state))).notes
+    except (Exception, KeyboardInterrupt):
+        if config.fallback_on_error:
+            return annotate_speed(collected.get('raw', ''))
+        return []
@@ -1,7 +1,13 @@
-"""Node implementations for the intake form graph."""
+"""Node implementations for the intake form graph.
 
-from typing import Dict, Any
+Nodes return only the state keys they change; LangGraph merges the update
+into the checkpointed state.
+"""
+
+from contextvars import ContextVar
+from typing import Dict, Any, Optional, Tuple
 from langchain_core.messages import AIMessage
+from langgraph.config import get_config as get_run_config
 
 from src.types import FormState
 from src.utils import (
@@ -10,47 +16,69 @@ from src.utils import (
     get_ordered_fields,
     get_field_index,
     should_show_field,
+    summarize_context,
 )
 from src.validation import validate_value
 from src.modes import (
     ask_speed,
     ask_quality,
+    aask_quality,
     process_speed,
     process_quality,
+    aprocess_quality,
     clarify_speed,
     clarify_quality,
+    aclarify_quality,
     annotate_speed,
     annotate_quality,
+    aannotate_quality,
     verify_quality,
+    averify_quality,
+    _field_key,
 )
 from src.config import AgentConfig
+from src.prefetch import QuestionPrefetcher, wait_for_result
+
 
+# Active config. A ContextVar, so concurrent sessions/eval cases (separate
+# asyncio tasks or copied contexts) can each run with their own config.
+_config_var: ContextVar[AgentConfig] = ContextVar("agent_config", default=AgentConfig())
 
-# Global config (can be set per graph instance)
-_config = AgentConfig()
+# Next-field questions generated while the current answer is validated
+_prefetcher = QuestionPrefetcher()
 
 
 def set_config(config: AgentConfig):
-    """Set global configuration."""
-    global _config
-    _config = config
+    """Set the configuration for the current context."""
+    _config_var.set(config)
+
+
+def get_config() -> AgentConfig:
+    """Get the configuration for the current context."""
+    return _config_var.get()
+
+
+_EXPLICIT_MODES = frozenset({"speed", "quality"})
+_FIELD_TYPE_NODES = frozenset({"ask", "process"})
 
 
 def get_mode_for_node(node: str, state: FormState) -> str:
     """Determine mode for a specific node (hybrid mode logic)."""
+    config = _config_var.get()
     # Check if state has explicit mode set
     state_mode = state.get("mode")
-    if state_mode and state_mode in ["speed", "quality"]:
-        if _config.default_mode != "hybrid":
-            return state_mode if state_mode == _config.default_mode else _config.default_mode
+    if state_mode in _EXPLICIT_MODES:
+        if config.default_mode != "hybrid":
+            return state_mode if state_mode == config.default_mode else config.default_mode
         # In hybrid mode, still respect state mode for testing
         if state_mode == "speed":
             return "speed"
     
-    if _config.default_mode != "hybrid":
-        return _config.default_mode
+    if config.default_mode != "hybrid":
+        return config.default_mode
     
-    field = get_field(state.get("current_field_id"), state.get("form_schema", {}))
+    field_id = state.get("current_field_id")
+    field = get_field(field_id, state.get("form_schema", {}))
     if not field:
         return "speed"
     
@@ -59,33 +87,116 @@ def get_mode_for_node(node: str, state: FormState) -> str:
         return "quality"
     
     # Use LLM for complex field types
-    if node in ["ask", "process"]:
+    if node in _FIELD_TYPE_NODES:
         field_type = field.get("field_type", "")
-        if field_type in _config.complex_field_types:
+        if field_type in config.complex_field_types:
             if len(field.get("description", "")) > 50:
                 return "quality"
     
     # Use LLM if previous extraction had low confidence
     if node == "process":
-        prev = state.get("collected_fields", {}).get(state.get("current_field_id"))
-        if prev and prev.get("confidence", 1.0) < _config.confidence_threshold:
+        prev = state.get("collected_fields", {}).get(field_id)
+        if prev and prev.get("confidence", 1.0) < config.confidence_threshold:
             return "quality"
     
     # Use LLM for annotation if response is complex
     if node == "annotate":
-        collected = state.get("collected_fields", {}).get(state.get("current_field_id"), {})
+        collected = state.get("collected_fields", {}).get(field_id, {})
         raw = collected.get("raw", "")
-        if len(raw) > _config.complex_response_length or len(raw.split()) > 20:
+        if len(raw) > config.complex_response_length or len(raw.split()) > 20:
             return "quality"
     
     return "speed"
 
 
+def _next_field_id(state: FormState) -> Optional[str]:
+    """Find the next applicable field after the current one."""
+    fields = get_ordered_fields(state.get("form_schema", {}))
+    current_idx = get_field_index(state.get("current_field_id"), fields)
+    collected = state.get("collected_fields", {})
+    
+    for i in range(current_idx + 1, len(fields)):
+        field = fields[i]
+        if should_show_field(field, collected):
+            return field.get("id")
+    return None
+
+
+def _run_thread_id() -> Optional[str]:
+    """thread_id of the graph run the caller is part of, if any."""
+    try:
+        return get_run_config().get("configurable", {}).get("thread_id")
+    except RuntimeError:
+        return None  # Called outside a graph run
+
+
+def _question_key(field: Dict[str, Any], context: Dict[str, Any]) -> tuple:
+    """Key a generated question by everything that shapes it.
+    
+    The prefetcher is shared by all sessions, so the key includes the
+    session (thread_id), the field's prompt attributes and the config as
+    well as the field id and context. Forms reusing a field id, and other
+    sessions, can't take each other's questions.
+    """
+    return (
+        _run_thread_id(),
+        field.get("id"),
+        _field_key(field),
+        _config_var.get(),
+        summarize_context(context),
+    )
+
+
+def _cancel_next_question(state: FormState, collected_fields: Dict[str, Any]) -> None:
+    """Drop speculation for the next field's question (its context is stale)."""
+    next_id = _next_field_id(state)
+    if next_id is not None:
+        field = get_field(next_id, state.get("form_schema", {}))
+        if field:
+            _prefetcher.cancel(_question_key(field, collected_fields))
+
+
+def _next_question_job(state: FormState) -> Optional[Tuple[tuple, Dict[str, Any], Dict[str, Any]]]:
+    """(key, field, context) for the next field's question, if it will need the LLM."""
+    next_id = _next_field_id(state)
+    if next_id is None:
+        return None
+    
+    next_state = {**state, "current_field_id": next_id}
+    if get_mode_for_node("ask", next_state) == "speed":
+        return None
+    
+    field = get_field(next_id, state.get("form_schema", {}))
+    context = state.get("collected_fields", {})
+    return _question_key(field, context), field, context
+
+
+def _prefetch_next_question(state: FormState) -> None:
+    """Start generating the next field's question on a background thread."""
+    job = _next_question_job(state)
+    if job is not None:
+        key, field, context = job
+        _prefetcher.submit(key, ask_quality, field, context, _config_var.get())
+
+
+def _aprefetch_next_question(state: FormState) -> None:
+    """Start generating the next field's question as a task on the running loop.
+    
+    It then overlaps with validation and annotation of the current answer.
+    """
+    job = _next_question_job(state)
+    if job is not None:
+        key, field, context = job
+        _prefetcher.submit_async(key, aask_quality, field, context, _config_var.get())
+
+
 def ask_node(state: FormState) -> FormState:
     """Generate question for current field."""
-    field = get_field(state.get("current_field_id"), state.get("form_schema", {}))
+    config = _config_var.get()
+    field_id = state.get("current_field_id")
+    field = get_field(field_id, state.get("form_schema", {}))
     if not field:
-        return state
+        return {}
     
     context = state.get("collected_fields", {})
     mode = get_mode_for_node("ask", state)
@@ -93,19 +204,56 @@ def ask_node(state: FormState) -> FormState:
     if mode == "speed":
         question = ask_speed(field, context)
     else:
-        question = ask_quality(field, context, _config)
+        prefetched = _prefetcher.pop(_question_key(field, context))
+        if prefetched is not None:
+            question = prefetched.result()
+        else:
+            question = ask_quality(field, context, config)
     
-    messages = state.get("messages", [])
-    messages.append(AIMessage(content=question))
+    # The add_messages reducer appends the new message to the history
+    message_idx = len(state.get("messages", []))
     
-    return {**state, "messages": messages}
+    return {
+        "messages": [AIMessage(content=question)],
+        "last_ai_message_idx": message_idx
+    }
+
+
+async def aask_node(state: FormState) -> FormState:
+    """Async version of `ask_node`."""
+    config = _config_var.get()
+    field_id = state.get("current_field_id")
+    field = get_field(field_id, state.get("form_schema", {}))
+    if not field:
+        return {}
+    
+    context = state.get("collected_fields", {})
+    mode = get_mode_for_node("ask", state)
+    
+    if mode == "speed":
+        question = ask_speed(field, context)
+    else:
+        prefetched = _prefetcher.pop(_question_key(field, context))
+        if prefetched is not None:
+            question = await wait_for_result(prefetched)
+        else:
+            question = await aask_quality(field, context, config)
+    
+    message_idx = len(state.get("messages", []))
+    
+    return {
+        "messages": [AIMessage(content=question)],
+        "last_ai_message_idx": message_idx
+    }
 
 
 def process_node(state: FormState) -> FormState:
     """Extract structured value from user input."""
-    field = get_field(state.get("current_field_id"), state.get("form_schema", {}))
+    config = _config_var.get()
+    field_id = state.get("current_field_id")
+    field = get_field(field_id, state.get("form_schema", {}))
     if not field:
-        return state
+        return {}
     
     user_input = get_last_user_message(state)
     mode = get_mode_for_node("process", state)
@@ -113,64 +261,162 @@ def process_node(state: FormState) -> FormState:
     if mode == "speed":
         result = process_speed(user_input, field)
     else:
-        result = process_quality(user_input, field, _config)
+        result = process_quality(user_input, field, config)
     
+    if config.prefetch_questions:
+        collected = {**state.get("collected_fields", {}), field_id: result}
+        _prefetch_next_question({**state, "collected_fields": collected})
+    
+    return {"collected_fields": {field_id: result}}
+
+
+async def aprocess_node(state: FormState) -> FormState:
+    """Async version of `process_node`."""
+    config = _config_var.get()
     field_id = state.get("current_field_id")
-    collected = state.get("collected_fields", {})
-    collected[field_id] = result
+    field = get_field(field_id, state.get("form_schema", {}))
+    if not field:
+        return {}
+    
+    user_input = get_last_user_message(state)
+    mode = get_mode_for_node("process", state)
+    
+    if mode == "speed":
+        result = process_speed(user_input, field)
+    else:
+        result = await aprocess_quality(user_input, field, config)
     
-    return {**state, "collected_fields": collected}
+    if config.prefetch_questions:
+        collected = {**state.get("collected_fields", {}), field_id: result}
+        _aprefetch_next_question({**state, "collected_fields": collected})
+    
+    return {"collected_fields": {field_id: result}}
+
+
+def _validation_update(
+    state: FormState,
+    field_id: str,
+    collected: Dict[str, Any],
+    result: Dict[str, Any],
+    config: AgentConfig
+) -> FormState:
+    """State update for a validation result.
+    
+    Once clarification attempts run out, `route_validation` accepts the
+    value anyway; the note saying so is added here, since routers can't
+    update state.
+    """
+    update: FormState = {"validation_result": result}
+    if not result.get("valid") and state.get("clarification_count", 0) >= config.max_clarification_attempts:
+        notes = [*collected.get("notes", []), "Accepted after max clarification attempts"]
+        update["collected_fields"] = {field_id: {**collected, "notes": notes}}
+    return update
 
 
 def validate_node(state: FormState) -> FormState:
     """Validate extracted value."""
-    field = get_field(state.get("current_field_id"), state.get("form_schema", {}))
+    config = _config_var.get()
+    field_id = state.get("current_field_id")
+    field = get_field(field_id, state.get("form_schema", {}))
     if not field:
-        return state
+        return {}
     
-    field_id = state.get("current_field_id")
     collected = state.get("collected_fields", {}).get(field_id, {})
     
     # Always do rule-based validation
     result = validate_value(collected.get("value"), field)
     
     # Quality mode adds LLM verification
-    mode = state.get("mode", _config.default_mode)
+    mode = state.get("mode", config.default_mode)
     if mode == "quality" and result.get("valid"):
-        result = verify_quality(collected, field, result, _config)
+        result = verify_quality(collected, field, result, config)
     
-    return {**state, "validation_result": result}
+    return _validation_update(state, field_id, collected, result, config)
+
+
+async def avalidate_node(state: FormState) -> FormState:
+    """Async version of `validate_node`."""
+    config = _config_var.get()
+    field_id = state.get("current_field_id")
+    field = get_field(field_id, state.get("form_schema", {}))
+    if not field:
+        return {}
+    
+    collected = state.get("collected_fields", {}).get(field_id, {})
+    
+    result = validate_value(collected.get("value"), field)
+    
+    mode = state.get("mode", config.default_mode)
+    if mode == "quality" and result.get("valid"):
+        result = await averify_quality(collected, field, result, config)
+    
+    return _validation_update(state, field_id, collected, result, config)
 
 
 def clarify_node(state: FormState) -> FormState:
     """Generate clarification request."""
-    field = get_field(state.get("current_field_id"), state.get("form_schema", {}))
+    config = _config_var.get()
+    field_id = state.get("current_field_id")
+    field = get_field(field_id, state.get("form_schema", {}))
     if not field:
-        return state
+        return {}
     
     errors = state.get("validation_result", {}).get("errors", [])
+    collected_fields = state.get("collected_fields", {})
+    collected = collected_fields.get(field_id, {})
+    attempt = state.get("clarification_count", 0) + 1
+    mode = get_mode_for_node("clarify", state)
+    
+    # The answer is being re-asked, so any next-question speculation is stale
+    _cancel_next_question(state, collected_fields)
+    
+    if mode == "speed":
+        message = clarify_speed(field, errors, attempt)
+    else:
+        message = clarify_quality(field, errors, collected, attempt, config)
+    
+    message_idx = len(state.get("messages", []))
+    
+    return {
+        "messages": [AIMessage(content=message)],
+        "last_ai_message_idx": message_idx,
+        "clarification_count": attempt
+    }
+
+
+async def aclarify_node(state: FormState) -> FormState:
+    """Async version of `clarify_node`."""
+    config = _config_var.get()
     field_id = state.get("current_field_id")
-    collected = state.get("collected_fields", {}).get(field_id, {})
+    field = get_field(field_id, state.get("form_schema", {}))
+    if not field:
+        return {}
+    
+    errors = state.get("validation_result", {}).get("errors", [])
+    collected_fields = state.get("collected_fields", {})
+    collected = collected_fields.get(field_id, {})
     attempt = state.get("clarification_count", 0) + 1
     mode = get_mode_for_node("clarify", state)
     
+    _cancel_next_question(state, collected_fields)
+    
     if mode == "speed":
         message = clarify_speed(field, errors, attempt)
     else:
-        message = clarify_quality(field, errors, collected, attempt, _config)
+        message = await aclarify_quality(field, errors, collected, attempt, config)
     
-    messages = state.get("messages", [])
-    messages.append(AIMessage(content=message))
+    message_idx = len(state.get("messages", []))
     
     return {
-        **state,
-        "messages": messages,
+        "messages": [AIMessage(content=message)],
+        "last_ai_message_idx": message_idx,
         "clarification_count": attempt
     }
 
 
 def annotate_node(state: FormState) -> FormState:
     """Detect and add notes to collected field."""
+    config = _config_var.get()
     field_id = state.get("current_field_id")
     collected = state.get("collected_fields", {}).get(field_id, {})
     mode = get_mode_for_node("annotate", state)
@@ -178,37 +424,38 @@ def annotate_node(state: FormState) -> FormState:
     if mode == "speed":
         notes = annotate_speed(collected.get("raw", ""))
     else:
-        notes = annotate_quality(collected, state, _config)
+        notes = annotate_quality(collected, state, config)
     
-    # Merge notes
+    # Merge notes, keeping order and dropping repeats
     existing_notes = collected.get("notes", [])
-    collected["notes"] = existing_notes + notes
+    merged = list(dict.fromkeys(existing_notes + notes))
     
-    collected_fields = state.get("collected_fields", {})
-    collected_fields[field_id] = collected
+    return {"collected_fields": {field_id: {**collected, "notes": merged}}}
+
+
+async def aannotate_node(state: FormState) -> FormState:
+    """Async version of `annotate_node`."""
+    config = _config_var.get()
+    field_id = state.get("current_field_id")
+    collected = state.get("collected_fields", {}).get(field_id, {})
+    mode = get_mode_for_node("annotate", state)
+    
+    if mode == "speed":
+        notes = annotate_speed(collected.get("raw", ""))
+    else:
+        notes = await aannotate_quality(collected, state, config)
+    
+    existing_notes = collected.get("notes", [])
+    merged = list(dict.fromkeys(existing_notes + notes))
     
-    return {**state, "collected_fields": collected_fields}
+    return {"collected_fields": {field_id: {**collected, "notes": merged}}}
 
 
 def advance_node(state: FormState) -> FormState:
     """Move to next applicable field."""
-    form_schema = state.get("form_schema", {})
-    fields = get_ordered_fields(form_schema)
-    current_id = state.get("current_field_id")
-    current_idx = get_field_index(current_id, fields)
-    
-    # Find next applicable field
-    next_field_id = None
-    collected = state.get("collected_fields", {})
-    
-    for i in range(current_idx + 1, len(fields)):
-        field = fields[i]
-        if should_show_field(field, collected):
-            next_field_id = field.get("id")
-            break
+    next_field_id = _next_field_id(state)
     
     return {
-        **state,
         "current_field_id": next_field_id,
         "is_complete": next_field_id is None,
         "clarification_count": 0,
@@ -218,28 +465,20 @@ def advance_node(state: FormState) -> FormState:
 
 def output_node(state: FormState) -> FormState:
     """Generate final output."""
-    # Output is the collected fields
-    return state
+    # Output is the collected fields, already in state
+    return {}
 
 
 def route_validation(state: FormState) -> str:
     """Route based on validation result."""
+    config = _config_var.get()
     result = state.get("validation_result", {})
     
     if result.get("valid"):
         return "valid"
     
-    # Max clarification attempts
-    if state.get("clarification_count", 0) >= _config.max_clarification_attempts:
-        # Accept with note
-        field_id = state.get("current_field_id")
-        collected = state.get("collected_fields", {})
-        field_data = collected.get(field_id, {})
-        notes = field_data.get("notes", [])
-        notes.append("Accepted after max clarification attempts")
-        field_data["notes"] = notes
-        collected[field_id] = field_data
-        state["collected_fields"] = collected
+    # Max clarification attempts (validate_node has added the note)
+    if state.get("clarification_count", 0) >= config.max_clarification_attempts:
         return "accept_with_note"
     
     return "invalid"
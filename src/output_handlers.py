@@ -1,10 +1,42 @@
 """Output handlers for collected form data."""
 
-import json
 import csv
+import itertools
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+import orjson
+
+
+_DUMPS_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _dumps(obj: Any, option: int = 0) -> bytes:
+    """Serialize to JSON bytes; values orjson can't handle are stringified."""
+    return orjson.dumps(obj, default=str, option=_DUMPS_OPTIONS | option)
+
+
+_now_cache: Tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """Current local time in ISO format, at second resolution.
+    
+    The string is rendered once per second and reused for every save in
+    that second.
+    """
+    global _now_cache
+    second = int(time.time())
+    if _now_cache[0] != second:
+        # Swap the whole tuple, so concurrent readers never see a mismatch
+        _now_cache = (second, datetime.fromtimestamp(second).isoformat())
+    return _now_cache[1]
 
 
 class OutputHandler:
@@ -24,87 +56,316 @@ class JSONOutputHandler(OutputHandler):
     
     def save(self, data: Dict[str, Any], metadata: Optional[Dict] = None) -> str:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"form_submission_{timestamp}.json"
-        filepath = self.output_dir / filename
         
         output = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "data": data,
             "metadata": metadata or {}
         }
         
-        with open(filepath, "w") as f:
-            json.dump(output, f, indent=2, default=str)
+        # Still indented: these files are meant to be read
+        body = _dumps(output, orjson.OPT_INDENT_2)
+        
+        # Filenames have second resolution; suffix a counter rather than
+        # overwrite another submission from the same second
+        for n in itertools.count():
+            suffix = f"_{n}" if n else ""
+            filepath = self.output_dir / f"form_submission_{timestamp}{suffix}.json"
+            try:
+                with open(filepath, "xb") as f:
+                    f.write(body)
+                break
+            except FileExistsError:
+                continue
         
         return str(filepath)
 
 
-class CSVOutputHandler(OutputHandler):
-    """Append data to CSV file."""
+class JSONLinesOutputHandler(OutputHandler):
+    """Append each submission as one line of a JSON Lines file.
     
-    def __init__(self, output_file: str = "output/submissions.csv"):
+    One file for all submissions instead of a file per submission. It is
+    opened on the first save and kept open; call `close` when done.
+    """
+    
+    def __init__(self, output_file: str = "output/submissions.jsonl"):
         self.output_file = Path(output_file)
         self.output_file.parent.mkdir(exist_ok=True)
+        self._file = None
+        self._lock = threading.Lock()
     
     def save(self, data: Dict[str, Any], metadata: Optional[Dict] = None) -> str:
-        # Flatten the data
+        line = _dumps({
+            "timestamp": _now_iso(),
+            "data": data,
+            "metadata": metadata or {}
+        }, orjson.OPT_APPEND_NEWLINE)
+        
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.output_file, "ab", buffering=1 << 16)
+            self._file.write(line)
+            self._file.flush()
+        
+        return str(self.output_file)
+    
+    def close(self) -> None:
+        """Close the JSON Lines file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class CSVOutputHandler(OutputHandler):
+    """Append data to CSV file.
+    
+    The file is opened on the first save and kept open; call `close` when done.
+    
+    Pass the form's `field_ids` to fix the columns: every row then has a
+    value and a notes column per field, in that order, plus the timestamp.
+    Without them, columns follow each submission's own keys.
+    """
+    
+    def __init__(
+        self,
+        output_file: str = "output/submissions.csv",
+        field_ids: Optional[Iterable[str]] = None
+    ):
+        self.output_file = Path(output_file)
+        self.output_file.parent.mkdir(exist_ok=True)
+        self._field_ids = tuple(field_ids) if field_ids is not None else None
+        self._header = None
+        if self._field_ids is not None:
+            self._header = [
+                column
+                for field_id in self._field_ids
+                for column in (field_id, f"{field_id}_notes")
+            ]
+            self._header.append("timestamp")
+        self._file = None
+        self._writer = None
+        self._lock = threading.Lock()
+    
+    def _flatten(self, data: Dict[str, Any]) -> Tuple[List[Any], List[str]]:
+        """Row values and the header that goes with them."""
+        if self._field_ids is not None:
+            entries = [data.get(field_id) or {} for field_id in self._field_ids]
+            row = [
+                cell
+                for entry in entries
+                for cell in (entry.get("value", ""), "; ".join(entry.get("notes") or ()))
+            ]
+            row.append(_now_iso())
+            return row, self._header
+        
         flat_data = {}
         for field_id, field_data in data.items():
             flat_data[field_id] = field_data.get("value", "")
-            if field_data.get("notes"):
-                flat_data[f"{field_id}_notes"] = "; ".join(field_data["notes"])
+            notes = field_data.get("notes")
+            if notes:
+                flat_data[f"{field_id}_notes"] = "; ".join(notes)
         
-        flat_data["timestamp"] = datetime.now().isoformat()
-        
-        # Check if file exists to determine if we need headers
-        file_exists = self.output_file.exists()
+        flat_data["timestamp"] = _now_iso()
+        return list(flat_data.values()), list(flat_data)
+    
+    def save(self, data: Dict[str, Any], metadata: Optional[Dict] = None) -> str:
+        row, header = self._flatten(data)
         
-        with open(self.output_file, "a", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=flat_data.keys())
-            if not file_exists:
-                writer.writeheader()
-            writer.writerow(flat_data)
+        with self._lock:
+            if self._file is None:
+                # Check if file exists to determine if we need headers
+                file_exists = self.output_file.exists()
+                self._file = open(self.output_file, "a", newline="", buffering=1 << 16)
+                self._writer = csv.writer(self._file)
+                if not file_exists:
+                    self._writer.writerow(header)
+            
+            self._writer.writerow(row)
+            self._file.flush()
         
         return str(self.output_file)
+    
+    def close(self) -> None:
+        """Close the CSV file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                self._writer = None
 
 
 class WebhookOutputHandler(OutputHandler):
-    """Send data to a webhook URL."""
+    """Send data to a webhook URL.
     
-    def __init__(self, webhook_url: str):
-        self.webhook_url = webhook_url
+    Posts go through one pooled `requests.Session`, so repeat submissions
+    reuse the connection instead of paying a TCP/TLS handshake each time.
     
-    def save(self, data: Dict[str, Any], metadata: Optional[Dict] = None) -> str:
+    `submit` sends in the background and returns a Future. With
+    `batch_size` > 1, submissions are buffered and posted as one JSON
+    array once the batch fills (or `flush_interval` seconds after its first
+    submission); `save` then queues instead of blocking. Call `flush` or
+    `close` to send whatever is still buffered.
+    """
+    
+    def __init__(
+        self,
+        webhook_url: str,
+        timeout: Tuple[float, float] = (3.05, 10.0),
+        max_retries: int = 3,
+        batch_size: int = 1,
+        max_workers: int = 4,
+        flush_interval: Optional[float] = None
+    ):
         import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        self.webhook_url = webhook_url
+        self.timeout = timeout  # (connect, read) seconds
+        
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(total=max_retries, backoff_factor=0.1)
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
         
-        payload = {
-            "timestamp": datetime.now().isoformat(),
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="webhook")
+        self._lock = threading.Lock()
+        self._pending: List[Dict[str, Any]] = []
+        self._pending_future: Optional[Future] = None
+        self._timer: Optional[threading.Timer] = None
+        self._in_flight: "set[Future]" = set()
+    
+    @staticmethod
+    def _payload(data: Dict[str, Any], metadata: Optional[Dict]) -> Dict[str, Any]:
+        return {
+            "timestamp": _now_iso(),
             "data": data,
             "metadata": metadata or {}
         }
-        
-        response = requests.post(
+    
+    def _post(self, body: Any) -> str:
+        response = self._session.post(
             self.webhook_url,
-            json=payload,
-            headers={"Content-Type": "application/json"}
+            data=_dumps(body),
+            headers={"Content-Type": "application/json"},
+            timeout=self.timeout
         )
         response.raise_for_status()
         
         return f"Sent to {self.webhook_url} (Status: {response.status_code})"
+    
+    def save(self, data: Dict[str, Any], metadata: Optional[Dict] = None) -> str:
+        if self.batch_size > 1:
+            self.submit(data, metadata)
+            return f"Queued for {self.webhook_url}"
+        return self._post(self._payload(data, metadata))
+    
+    def submit(self, data: Dict[str, Any], metadata: Optional[Dict] = None) -> Future:
+        """Send in the background; the Future resolves when its batch is posted."""
+        payload = self._payload(data, metadata)
+        if self.batch_size <= 1:
+            return self._track(self._executor.submit(self._post, payload))
+        
+        with self._lock:
+            if self._pending_future is None:
+                self._pending_future = Future()
+                if self.flush_interval:
+                    self._timer = threading.Timer(self.flush_interval, self._dispatch)
+                    self._timer.daemon = True
+                    self._timer.start()
+            future = self._pending_future
+            self._pending.append(payload)
+            full = len(self._pending) >= self.batch_size
+        
+        if full:
+            self._dispatch()
+        return future
+    
+    def _track(self, future: Future) -> Future:
+        with self._lock:
+            self._in_flight.add(future)
+        future.add_done_callback(self._untrack)
+        return future
+    
+    def _untrack(self, future: Future) -> None:
+        with self._lock:
+            self._in_flight.discard(future)
+    
+    def _dispatch(self) -> None:
+        """Hand the buffered batch to the executor."""
+        with self._lock:
+            batch, future = self._pending, self._pending_future
+            self._pending, self._pending_future = [], None
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not batch:
+            return
+        
+        def send():
+            try:
+                future.set_result(self._post(batch))
+            except Exception as e:
+                future.set_exception(e)
+        
+        self._track(future)
+        self._executor.submit(send)
+    
+    def flush(self) -> None:
+        """Post any buffered batch and wait for all in-flight requests."""
+        self._dispatch()
+        with self._lock:
+            in_flight = list(self._in_flight)
+        for future in in_flight:
+            future.exception()  # Wait; errors surface on the caller's Future
+    
+    def close(self) -> None:
+        """Send what is buffered, then close pooled connections."""
+        self.flush()
+        self._executor.shutdown()
+        self._session.close()
 
 
 class DatabaseOutputHandler(OutputHandler):
-    """Save data to a database (example with SQLite)."""
+    """Save data to a database (example with SQLite).
+    
+    Keeps one connection open in WAL mode; call `close` when done.
+    
+    With `background=True`, `save` only queues the row. A writer thread
+    inserts queued rows in batches of up to `max_batch`, collected for at
+    most `max_wait` seconds, with one commit per batch. `flush` waits for
+    the queue to drain and re-raises a failed write.
+    """
+    
+    _INSERT = "INSERT INTO submissions (timestamp, data, metadata) VALUES (?, ?, ?)"
+    _STOP = object()
     
-    def __init__(self, db_path: str = "output/submissions.db"):
-        import sqlite3
+    def __init__(
+        self,
+        db_path: str = "output/submissions.db",
+        background: bool = False,
+        max_batch: int = 128,
+        max_wait: float = 0.05
+    ):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(exist_ok=True)
         
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # WAL with synchronous=NORMAL syncs at checkpoints, not on every commit
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        
         # Initialize database
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
+        self._conn.execute("""
             CREATE TABLE IF NOT EXISTS submissions (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 timestamp TEXT NOT NULL,
@@ -112,26 +373,94 @@ class DatabaseOutputHandler(OutputHandler):
                 metadata TEXT
             )
         """)
-        conn.commit()
-        conn.close()
-    
-    def save(self, data: Dict[str, Any], metadata: Optional[Dict] = None) -> str:
-        import sqlite3
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        self._conn.commit()
         
-        cursor.execute(
-            "INSERT INTO submissions (timestamp, data, metadata) VALUES (?, ?, ?)",
-            (
-                datetime.now().isoformat(),
-                json.dumps(data, default=str),
-                json.dumps(metadata or {}, default=str)
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._error: Optional[BaseException] = None
+        self._queue: Optional[queue.Queue] = None
+        self._writer: Optional[threading.Thread] = None
+        if background:
+            self._queue = queue.Queue()
+            self._writer = threading.Thread(
+                target=self._write_loop, name="sqlite-writer", daemon=True
             )
+            self._writer.start()
+    
+    @staticmethod
+    def _row(data: Dict[str, Any], metadata: Optional[Dict]) -> Tuple[str, str, str]:
+        return (
+            _now_iso(),
+            _dumps(data).decode(),
+            _dumps(metadata or {}).decode()
         )
+    
+    def save(self, data: Dict[str, Any], metadata: Optional[Dict] = None) -> str:
+        row = self._row(data, metadata)
+        if self._queue is not None:
+            self._queue.put(row)
+            return f"Queued for database {self.db_path}"
         
-        submission_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        with self._lock:
+            submission_id = self._conn.execute(self._INSERT, row).lastrowid
+            self._conn.commit()
         
         return f"Saved to database with ID: {submission_id}"
+    
+    def save_many(self, submissions: Iterable[Tuple[Dict[str, Any], Optional[Dict]]]) -> str:
+        """Save (data, metadata) pairs in a single transaction."""
+        rows = [self._row(data, metadata) for data, metadata in submissions]
+        with self._lock:
+            self._conn.executemany(self._INSERT, rows)
+            self._conn.commit()
+        
+        return f"Saved {len(rows)} submissions to database"
+    
+    def _write_loop(self) -> None:
+        stop = False
+        while not stop:
+            rows = []
+            item = self._queue.get()
+            deadline = time.monotonic() + self.max_wait
+            while True:
+                if item is self._STOP:
+                    stop = True
+                    break
+                rows.append(item)
+                remaining = deadline - time.monotonic()
+                if len(rows) >= self.max_batch or remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            
+            try:
+                if rows:
+                    with self._lock:
+                        self._conn.executemany(self._INSERT, rows)
+                        self._conn.commit()
+            except sqlite3.Error as e:
+                self._error = e
+            finally:
+                for _ in range(len(rows) + stop):
+                    self._queue.task_done()
+    
+    def flush(self) -> None:
+        """Wait until queued rows are committed."""
+        if self._queue is not None:
+            self._queue.join()
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+    
+    def close(self) -> None:
+        """Write what is queued, then release the database connection."""
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.put(self._STOP)
+            self._writer.join()
+        with self._lock:
+            self._conn.close()
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
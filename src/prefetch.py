@@ -0,0 +1,100 @@
+"""Speculative background generation of upcoming questions."""
+
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Hashable, Optional, Union
+
+Pending = Union[Future, asyncio.Future]
+
+
+def _cancel(future: Pending) -> None:
+    """Cancel a pending result from any thread."""
+    if isinstance(future, asyncio.Future):
+        try:
+            future.get_loop().call_soon_threadsafe(future.cancel)
+        except RuntimeError:
+            pass  # Loop already closed; the task is gone with it
+    else:
+        future.cancel()
+
+
+def _on_running_loop(future: Pending) -> bool:
+    """Whether an asyncio result can be awaited from the current context."""
+    try:
+        return future.get_loop() is asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+
+
+async def wait_for_result(future: Pending) -> Any:
+    """Await a result from `pop`, whether it runs on a thread or the event loop."""
+    if isinstance(future, asyncio.Future):
+        return await future
+    return await asyncio.wrap_future(future)
+
+
+class QuestionPrefetcher:
+    """Run question generation ahead of time, keyed by what it depends on.
+
+    Callers submit work under a key describing its inputs (e.g. field id plus
+    a context summary) and later `pop` it with the key they would have used
+    to generate the result themselves. A key that no longer matches is
+    simply a miss, so stale speculation is never returned.
+
+    Work runs on a small thread pool (`submit`) or, from async code, as a
+    task on the running event loop (`submit_async`).
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 32):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="question-prefetch"
+        )
+        self._max_pending = max_pending
+        self._pending: "OrderedDict[Hashable, Pending]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def submit(self, key: Hashable, fn: Callable[..., Any], *args: Any) -> None:
+        """Start `fn(*args)` in the background unless `key` is already pending."""
+        self._add(key, lambda: self._executor.submit(fn, *args))
+
+    def submit_async(self, key: Hashable, fn: Callable[..., Awaitable[Any]], *args: Any) -> None:
+        """Start coroutine `fn(*args)` as a task on the running loop unless `key` is pending."""
+        self._add(key, lambda: asyncio.ensure_future(fn(*args)))
+
+    def _add(self, key: Hashable, start: Callable[[], Pending]) -> None:
+        with self._lock:
+            if key in self._pending:
+                return
+            self._pending[key] = start()
+            # Drop the oldest speculation once too many are outstanding
+            while len(self._pending) > self._max_pending:
+                _, stale = self._pending.popitem(last=False)
+                _cancel(stale)
+
+    def pop(self, key: Hashable) -> Optional[Pending]:
+        """Take the pending result for `key`, or None if there is none.
+
+        A task started on another event loop cannot be awaited here and
+        counts as a miss.
+        """
+        with self._lock:
+            future = self._pending.pop(key, None)
+        if future is None or future.cancelled():
+            return None
+        if isinstance(future, asyncio.Future) and not _on_running_loop(future):
+            _cancel(future)
+            return None
+        return future
+
+    def cancel(self, key: Hashable) -> None:
+        """Discard speculation for `key` (cancelling it if not yet started)."""
+        with self._lock:
+            future = self._pending.pop(key, None)
+        if future is not None:
+            _cancel(future)
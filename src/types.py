@@ -1,18 +1,59 @@
 """Type definitions for the intake form agent."""
 
-from typing import TypedDict, Literal, Optional, Any
+from typing import Annotated, TypedDict, Literal, Optional, Union, Any
 from langchain_core.messages import BaseMessage
+from langgraph.graph.message import add_messages
+from pydantic import BaseModel, Field
+
+
+def _merge_collected(left: dict[str, Any], right: dict[str, Any]) -> dict[str, Any]:
+    """Reducer for `collected_fields`: nodes return only the entries they changed."""
+    if not right:
+        return left
+    return {**left, **right}
 
 
 class FormState(TypedDict):
     """State schema for the intake form graph."""
-    messages: list[BaseMessage]
+    messages: Annotated[list[BaseMessage], add_messages]
     form_schema: dict[str, Any]
     current_field_id: Optional[str]
-    collected_fields: dict[str, Any]
+    collected_fields: Annotated[dict[str, Any], _merge_collected]
     validation_result: dict[str, Any]
     clarification_count: int
     is_complete: bool
     notes: list[str]
     mode: Literal["speed", "quality"]
+    last_ai_message_idx: Optional[int]  # Index of the latest agent message
+
+
+# Structured LLM outputs (bound with `with_structured_output`)
+
+class ExtractionResult(BaseModel):
+    """Value extracted from a user's answer."""
+    value: Optional[Union[float, bool, str]] = Field(
+        description="Extracted value in the field's type"
+    )
+    confidence: float = Field(description="Confidence in the extraction, 0.0-1.0")
+    notes: list[str] = Field(
+        default_factory=list,
+        description="Observations about ambiguity or uncertainty"
+    )
+
+
+class VerificationResult(BaseModel):
+    """Verdict on whether an extracted value matches what the user meant."""
+    valid: bool
+    needs_clarification: bool = False
+    reason: Optional[str] = Field(
+        default=None,
+        description="Explanation if invalid or ambiguous"
+    )
+
 
+class AnnotationResult(BaseModel):
+    """Notable observations about a response."""
+    notes: list[str] = Field(
+        default_factory=list,
+        description="Notes (empty if nothing notable)"
+    )
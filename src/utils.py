@@ -1,18 +1,40 @@
 """Utility functions for the intake form agent."""
 
-from typing import Dict, Any, Optional
+import asyncio
+import operator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple
+
+from langchain_core.messages import HumanMessage
+
+
+# id(fields) -> (fields, len(fields), {field_id: (index, field)}). Entries hold
+# their list, so an id is not reused while cached; the length check catches
+# fields appended after indexing.
+_field_indexes: Dict[int, Tuple[list, int, Dict[str, Tuple[int, Dict[str, Any]]]]] = {}
+
+
+def _field_index(fields: list) -> Dict[str, Tuple[int, Dict[str, Any]]]:
+    """Map field ids to (position, field) for a fields list, built once per list."""
+    entry = _field_indexes.get(id(fields))
+    if entry is None or entry[0] is not fields or entry[1] != len(fields):
+        index: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        for i, field in enumerate(fields):
+            index.setdefault(field.get("id"), (i, field))  # First match wins
+        if len(_field_indexes) >= 32:
+            _field_indexes.clear()
+        entry = _field_indexes[id(fields)] = (fields, len(fields), index)
+    return entry[2]
 
 
 def get_field(field_id: Optional[str], form_schema: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Get field definition from schema by ID."""
-    if not field_id:
+    fields = form_schema.get("fields")
+    if not field_id or not fields:
         return None
     
-    fields = form_schema.get("fields", [])
-    for field in fields:
-        if field.get("id") == field_id:
-            return field
-    return None
+    found = _field_index(fields).get(field_id)
+    return found[1] if found else None
 
 
 def get_ordered_fields(form_schema: Dict[str, Any]) -> list:
@@ -22,24 +44,24 @@ def get_ordered_fields(form_schema: Dict[str, Any]) -> list:
 
 def get_field_index(field_id: Optional[str], fields: list) -> int:
     """Get index of field in ordered list."""
-    if not field_id:
+    if not field_id or not fields:
         return -1
     
-    for i, field in enumerate(fields):
-        if field.get("id") == field_id:
-            return i
-    return -1
+    found = _field_index(fields).get(field_id)
+    return found[0] if found else -1
 
 
 def get_last_user_message(state: Dict[str, Any]) -> str:
     """Extract the last user message from state."""
     messages = state.get("messages", [])
     for msg in reversed(messages):
-        if hasattr(msg, "content") and hasattr(msg, "type"):
-            if msg.type == "human":
-                return msg.content
-        elif isinstance(msg, dict) and msg.get("type") == "human":
-            return msg.get("content", "")
+        if type(msg) is HumanMessage:  # Common case, one check
+            return msg.content
+        if isinstance(msg, dict):
+            if msg.get("type") == "human":
+                return msg.get("content", "")
+        elif getattr(msg, "type", None) == "human":
+            return msg.content
     return ""
 
 
@@ -48,12 +70,27 @@ def summarize_context(collected_fields: Dict[str, Any]) -> str:
     if not collected_fields:
         return "No previous responses."
     
-    summary = []
-    for field_id, data in collected_fields.items():
-        value = data.get("value", "")
-        summary.append(f"{field_id}: {value}")
-    
-    return "; ".join(summary)
+    # A list comprehension, not a generator: join builds a list from a
+    # generator anyway, so this skips that extra pass
+    return "; ".join([
+        f"{field_id}: {data.get('value', '')}"
+        for field_id, data in collected_fields.items()
+    ])
+
+
+def _always_true(value: Any, target: Any) -> bool:
+    return True
+
+
+# Conditional operators: (collected value, target) -> show field
+_CONDITION_OPS = {
+    "equals": operator.eq,
+    "not_equals": operator.ne,
+    "contains": lambda v, t: t in str(v),
+    "greater_than": lambda v, t: float(v) > float(t),
+    "less_than": lambda v, t: float(v) < float(t),
+    "in": lambda v, t: v in t if isinstance(t, list) else False,
+}
 
 
 def should_show_field(field: Dict[str, Any], collected: Dict[str, Any]) -> bool:
@@ -67,17 +104,19 @@ def should_show_field(field: Dict[str, Any], collected: Dict[str, Any]) -> bool:
         return False
     
     value = collected[depends_on].get("value")
-    target = cond.get("value")
-    op = cond.get("condition", "equals")
-    
-    ops = {
-        "equals": lambda v, t: v == t,
-        "not_equals": lambda v, t: v != t,
-        "contains": lambda v, t: t in str(v),
-        "greater_than": lambda v, t: float(v) > float(t),
-        "less_than": lambda v, t: float(v) < float(t),
-        "in": lambda v, t: v in t if isinstance(t, list) else False,
-    }
-    
-    return ops.get(op, lambda v, t: True)(value, target)
+    op = _CONDITION_OPS.get(cond.get("condition", "equals"), _always_true)
+    return op(value, cond.get("value"))
 
+
+# Dedicated stdin reader, so a pending prompt never occupies (or queues
+# behind) the default executor used for other blocking work
+_stdin_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stdin")
+
+
+async def ainput(prompt: str = "") -> Optional[str]:
+    """Read a line from stdin without blocking the event loop (None on EOF)."""
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(_stdin_executor, input, prompt)
+    except EOFError:
+        return None
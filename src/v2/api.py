@@ -3,25 +3,33 @@
 Endpoints:
 - POST /api/forms/start - Create a new form session
 - POST /api/forms/answer - Submit an answer to the current question
+- POST /api/forms/answer/stream - Submit an answer, streaming progress as SSE
 - GET /api/forms/result/{session_id} - Get collected form data
 
 Example usage:
     uvicorn src.v2.api:app --reload --port 8000
 """
 
+import asyncio
 import os
 import uuid
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional
 from datetime import datetime
 
+import orjson
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from langchain_core.messages import HumanMessage
+from langgraph.checkpoint.memory import MemorySaver
 
-from src.v2.session import create_session
+from src.graph import create_intake_graph
+from src.nodes import set_config
+from src.v2.session import create_session, get_mode_config
+from src.v2.session_store import get_session_store
 
 # Load environment variables
 load_dotenv()
@@ -42,8 +50,70 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# In-memory session store (in production, use Redis/DB)
-_sessions: Dict[str, Dict[str, Any]] = {}
+# Conversation state lives in one checkpointer shared by all sessions (the
+# session id is the thread_id). Multi-worker deployments need a shared
+# checkpointer here as well as SESSION_REDIS_URL for the metadata store.
+_checkpointer = MemorySaver()
+_graph = create_intake_graph(checkpointer=_checkpointer)
+
+# Per-session metadata (form_id, mode, created_at); sessions expire an hour
+# after last use and then also drop their checkpoints
+_store = get_session_store(on_evict=_checkpointer.delete_thread)
+
+
+def _load_session(session_id: str) -> Dict[str, Any]:
+    """Session metadata, with this session's config restored for the run."""
+    meta = _store.get(session_id)
+    if meta is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Session {session_id} not found"
+        )
+    # Config is context-local, so restore this session's for the run
+    set_config(get_mode_config(meta["mode"]))
+    return meta
+
+
+def _run_config(session_id: str) -> Dict[str, Any]:
+    return {"configurable": {"thread_id": session_id}}
+
+
+def _run_to_interrupt(graph, state: Optional[Dict[str, Any]], config_run: Dict[str, Any]) -> Dict[str, Any]:
+    """Run the graph until it waits for input; returns the state values.
+    
+    Blocks on LLM calls, so endpoints call it via `asyncio.to_thread` (which
+    also carries over the session config set in the request's context).
+    """
+    for _ in graph.stream(state, config_run):
+        pass
+    return graph.get_state(config_run).values
+
+
+def _add_answer(config_run: Dict[str, Any], message: str) -> Optional[str]:
+    """Add the user's answer to the checkpoint (blocking).
+    
+    Returns the id of the field the answer is for.
+    """
+    field_id = _graph.get_state(config_run).values.get("current_field_id")
+    _graph.update_state(
+        config_run,
+        {"messages": [HumanMessage(content=message)]},
+    )
+    return field_id
+
+
+def _resume(config_run: Dict[str, Any], message: str) -> Dict[str, Any]:
+    """Add the user's answer and run to the next question (blocking)."""
+    _add_answer(config_run, message)
+    return _run_to_interrupt(_graph, None, config_run)
+
+
+def _last_question(values: Dict[str, Any]) -> Optional[str]:
+    """Content of the latest agent message, located via `last_ai_message_idx`."""
+    idx = values.get("last_ai_message_idx")
+    if idx is None:
+        return None
+    return values["messages"][idx].content
 
 
 # Request/Response Models
@@ -98,7 +168,11 @@ async def start_form(request: StartFormRequest) -> StartFormResponse:
         )
     
     # Create session
-    session = create_session(form_id=request.form_id, mode=request.mode)
+    session = create_session(
+        form_id=request.form_id,
+        mode=request.mode,
+        checkpointer=_checkpointer
+    )
     graph = session["graph"]
     state = session["state"]
     
@@ -106,76 +180,37 @@ async def start_form(request: StartFormRequest) -> StartFormResponse:
     session_id = str(uuid.uuid4())
     
     # Run graph to get first question
-    config_run = {"configurable": {"thread_id": session_id}}
-    
-    # Stream until we get a question
-    for _ in graph.stream(state, config_run):
-        pass
+    config_run = _run_config(session_id)
     
-    # Get current state and extract question
-    current_state = graph.get_state(config_run)
-    messages = current_state.values.get("messages", [])
-    
-    # Find last AI message (the question)
-    question = ""
-    for msg in reversed(messages):
-        msg_type = getattr(msg, "type", None) or getattr(msg, "role", None) or msg.__dict__.get("type")
-        if msg_type == "ai":
-            question = getattr(msg, "content", "") or getattr(msg, "text", "")
-            break
+    # Run until we get a question, off the event loop
+    values = await asyncio.to_thread(_run_to_interrupt, graph, state, config_run)
+    question = _last_question(values) or ""
     
     # Store session
-    _sessions[session_id] = {
-        "graph": graph,
-        "config_run": config_run,
+    _store.put(session_id, {
         "form_id": request.form_id,
         "mode": request.mode,
         "created_at": datetime.now().isoformat(),
-    }
+    })
     
     return StartFormResponse(
         session_id=session_id,
         question=question,
-        is_complete=current_state.values.get("is_complete", False),
+        is_complete=values.get("is_complete", False),
     )
 
 
 @app.post("/api/forms/answer", response_model=AnswerResponse)
 async def submit_answer(request: AnswerRequest) -> AnswerResponse:
     """Submit an answer and get the next question or completion status."""
-    # Check session exists
-    if request.session_id not in _sessions:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Session {request.session_id} not found"
-        )
+    _load_session(request.session_id)
+    config_run = _run_config(request.session_id)
     
-    session_data = _sessions[request.session_id]
-    graph = session_data["graph"]
-    config_run = session_data["config_run"]
+    # Add user message and resume graph until next question or completion,
+    # off the event loop
+    values = await asyncio.to_thread(_resume, config_run, request.message)
     
-    # Add user message and resume graph
-    graph.update_state(
-        config_run,
-        {"messages": [HumanMessage(content=request.message)]},
-    )
-    
-    # Stream until next question or completion
-    for _ in graph.stream(None, config_run):
-        pass
-    
-    # Get updated state
-    current_state = graph.get_state(config_run)
-    values = current_state.values
-    
-    # Extract question from messages
-    messages = values.get("messages", [])
-    question = None
-    for msg in reversed(messages):
-        msg_type = getattr(msg, "type", None) or getattr(msg, "role", None) or msg.__dict__.get("type")
-        if msg_type == "ai":
-            question = getattr(msg, "content", "") or getattr(msg, "text", "")
-            break
+    question = _last_question(values)
     
     is_complete = values.get("is_complete", False)
     collected_fields = values.get("collected_fields", {})
@@ -187,21 +222,60 @@ async def submit_answer(request: AnswerRequest) -> AnswerResponse:
     )
 
 
+def _sse_event(event: str, data: Dict[str, Any]) -> str:
+    """Format a server-sent event."""
+    # orjson writes UTF-8 as-is rather than \u-escaping it like json.dumps
+    return f"event: {event}\ndata: {orjson.dumps(data, default=str).decode()}\n\n"
+
+
+def _answer_events(graph, config_run: Dict[str, Any], field_id: Optional[str]) -> Iterator[str]:
+    """Run the graph to its next interrupt, yielding SSE events as nodes finish."""
+    for update in graph.stream(None, config_run, stream_mode="updates"):
+        for node, values in update.items():
+            if not values:
+                continue
+            if node == "annotate":
+                field_data = values.get("collected_fields", {}).get(field_id, {})
+                yield _sse_event("field", {"field_id": field_id, "value": field_data.get("value")})
+            elif node in ("ask", "clarify"):
+                messages = values.get("messages", [])
+                if messages:
+                    yield _sse_event("question", {"question": messages[-1].content})
+    
+    values = graph.get_state(config_run).values
+    yield _sse_event("done", {
+        "is_complete": values.get("is_complete", False),
+        "collected_fields": values.get("collected_fields", {}),
+    })
+
+
+@app.post("/api/forms/answer/stream")
+async def submit_answer_stream(request: AnswerRequest) -> StreamingResponse:
+    """Submit an answer and stream progress as server-sent events.
+
+    Emits `field` once the answer is accepted, `question` as soon as the next
+    question (or clarification) is generated, and a final `done` event.
+    """
+    _load_session(request.session_id)
+    graph = _graph
+    config_run = _run_config(request.session_id)
+    
+    field_id = await asyncio.to_thread(_add_answer, config_run, request.message)
+    
+    # StreamingResponse iterates sync generators in a worker thread
+    return StreamingResponse(
+        _answer_events(graph, config_run, field_id),
+        media_type="text/event-stream",
+    )
+
+
 @app.get("/api/forms/result/{session_id}", response_model=FormResultResponse)
 async def get_result(session_id: str) -> FormResultResponse:
     """Get the final collected form data for a completed session."""
-    if session_id not in _sessions:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Session {session_id} not found"
-        )
-    
-    session_data = _sessions[session_id]
-    graph = session_data["graph"]
-    config_run = session_data["config_run"]
+    session_data = _load_session(session_id)
     
     # Get current state
-    current_state = graph.get_state(config_run)
+    current_state = _graph.get_state(_run_config(session_id))
     values = current_state.values
     
     collected_fields = values.get("collected_fields", {})
@@ -6,8 +6,10 @@ This module provides a clean API for:
 - Getting back a compiled graph ready to run
 """
 
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Optional
 
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.checkpoint.memory import MemorySaver
 
 from src.config import AgentConfig
@@ -16,9 +18,25 @@ from src.nodes import set_config
 from src.v2.forms_registry import get_form_schema
 
 
-def create_session(form_id: str, mode: str = "hybrid") -> Dict[str, Any]:
+@lru_cache(maxsize=8)
+def get_mode_config(mode: str) -> AgentConfig:
+    """Agent config for a session mode.
+
+    Configs are frozen, so one instance per mode is shared by all sessions.
+    """
+    return AgentConfig(default_mode=mode)
+
+
+def create_session(
+    form_id: str,
+    mode: str = "hybrid",
+    checkpointer: Optional[BaseCheckpointSaver] = None
+) -> Dict[str, Any]:
     """Create a new intake form session for a specific pre-built form.
 
+    Sessions may share a `checkpointer` (each runs under its own thread_id);
+    a fresh in-memory one is used if none is given.
+
     Returns a dict with:
     - graph: compiled LangGraph
     - state: initial FormState values
@@ -28,13 +46,14 @@ def create_session(form_id: str, mode: str = "hybrid") -> Dict[str, Any]:
     if not schema:
         raise ValueError(f"Unknown form_id: {form_id}")
 
-    config = AgentConfig(default_mode=mode)
+    # Context-local, so concurrent sessions with other modes are unaffected
+    config = get_mode_config(mode)
     set_config(config)
 
-    # For V2.0 CLI/API usage we always use an in-memory checkpointer so that
-    # `graph.get_state` works as expected between steps.
-    checkpointer = MemorySaver()
-    graph = create_intake_graph(checkpointer=checkpointer)
+    # A checkpointer is required so that `graph.get_state` works between steps
+    if checkpointer is None:
+        checkpointer = MemorySaver()
+    graph = create_intake_graph(checkpointer=checkpointer, form_schema=schema)
 
     fields = schema.get("fields", [])
     if not fields:
@@ -50,6 +69,7 @@ def create_session(form_id: str, mode: str = "hybrid") -> Dict[str, Any]:
         "is_complete": False,
         "notes": [],
         "mode": mode,
+        "last_ai_message_idx": None,
     }
 
     return {
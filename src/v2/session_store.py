@@ -0,0 +1,176 @@
+"""Session metadata stores for the V2.0 HTTP API.
+
+Only small per-session metadata (form_id, mode, created_at) lives here; the
+conversation itself is in the LangGraph checkpointer, keyed by the session
+id as `thread_id`. With Redis, API workers keep no session state of their
+own.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Protocol, Tuple
+
+import orjson
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    redis = None
+
+
+DEFAULT_SESSION_TTL = 3600  # seconds
+
+
+class SessionStore(Protocol):
+    """Storage for session metadata."""
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]: ...
+
+    def put(self, session_id: str, meta: Dict[str, Any]) -> None: ...
+
+
+class MemorySessionStore:
+    """In-process store; sessions expire `ttl` seconds after they were last used.
+
+    `on_evict(session_id)` is called for expired sessions, e.g. to drop their
+    checkpoints from an in-memory checkpointer.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = DEFAULT_SESSION_TTL,
+        on_evict: Optional[Callable[[str], None]] = None
+    ):
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self._sessions: Dict[str, Tuple[Dict[str, Any], Optional[float]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Session metadata, or None; a hit pushes the expiry back by `ttl`."""
+        now = time.time()
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return None
+            meta, expires_at = entry
+            expired = expires_at is not None and expires_at < now
+            if not expired and expires_at is not None:
+                self._sessions[session_id] = (meta, now + self.ttl)
+        if expired:
+            self._evict([session_id])
+            return None
+        return meta
+
+    def put(self, session_id: str, meta: Dict[str, Any]) -> None:
+        now = time.time()
+        with self._lock:
+            self._sessions[session_id] = (meta, now + self.ttl if self.ttl else None)
+            expired = [
+                sid for sid, (_, expires_at) in self._sessions.items()
+                if expires_at is not None and expires_at < now
+            ]
+        self._evict(expired)
+
+    def _evict(self, session_ids: list) -> None:
+        for session_id in session_ids:
+            with self._lock:
+                if self._sessions.pop(session_id, None) is None:
+                    continue
+            if self.on_evict is not None:
+                self.on_evict(session_id)
+
+
+class RedisSessionStore:
+    """Shared store in Redis (requires the `redis` package).
+
+    Keys expire `ttl` seconds after they were last read or written. Redis
+    does not tell this worker when a key expires, so with `on_evict` the
+    sessions this worker has served are tracked locally: once one is past
+    its local deadline, Redis is asked whether it is still live (another
+    worker may have used it), and `on_evict` is called if it is gone.
+    """
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        ttl: Optional[float] = DEFAULT_SESSION_TTL,
+        prefix: str = "form_session:",
+        on_evict: Optional[Callable[[str], None]] = None
+    ):
+        if not REDIS_AVAILABLE:
+            raise ImportError(
+                "redis is required for the Redis session store. "
+                "Install with: pip install redis"
+            )
+        self.ttl = ttl
+        self.prefix = prefix
+        self.on_evict = on_evict
+        self._client = redis.Redis.from_url(url)
+        self._deadlines: Dict[str, float] = {}  # Sessions served by this worker
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Session metadata, or None; a hit pushes the expiry back by `ttl`."""
+        key = self.prefix + session_id
+        if self.ttl:
+            raw = self._client.getex(key, ex=int(self.ttl))
+        else:
+            raw = self._client.get(key)
+        if raw is None:
+            self._evict([session_id])
+            return None
+        self._track(session_id)
+        return orjson.loads(raw)
+
+    def put(self, session_id: str, meta: Dict[str, Any]) -> None:
+        self._client.set(
+            self.prefix + session_id,
+            orjson.dumps(meta),
+            ex=int(self.ttl) if self.ttl else None
+        )
+        self._track(session_id)
+        self._sweep()
+
+    def _track(self, session_id: str) -> None:
+        if self.on_evict is not None and self.ttl:
+            with self._lock:
+                self._deadlines[session_id] = time.time() + self.ttl
+
+    def _sweep(self) -> None:
+        """Evict tracked sessions whose Redis keys have expired."""
+        now = time.time()
+        with self._lock:
+            due = [sid for sid, deadline in self._deadlines.items() if deadline < now]
+        expired = []
+        for session_id in due:
+            remaining = self._client.ttl(self.prefix + session_id)
+            if remaining == -2:  # No such key
+                expired.append(session_id)
+            else:
+                with self._lock:
+                    self._deadlines[session_id] = now + (remaining if remaining > 0 else self.ttl)
+        self._evict(expired)
+
+    def _evict(self, session_ids: list) -> None:
+        for session_id in session_ids:
+            with self._lock:
+                if self._deadlines.pop(session_id, None) is None:
+                    continue
+            self.on_evict(session_id)
+
+
+def get_session_store(on_evict: Optional[Callable[[str], None]] = None) -> SessionStore:
+    """Redis store if SESSION_REDIS_URL is set, in-memory otherwise.
+
+    SESSION_TTL_SECONDS overrides the default one-hour expiry. Either way,
+    `on_evict` is called for expired sessions this process has served.
+    """
+    ttl = float(os.getenv("SESSION_TTL_SECONDS", DEFAULT_SESSION_TTL))
+    url = os.getenv("SESSION_REDIS_URL")
+    if url:
+        return RedisSessionStore(url, ttl=ttl, on_evict=on_evict)
+    return MemorySessionStore(ttl=ttl, on_evict=on_evict)
@@ -1,13 +1,16 @@
 """Bridge between LangGraph agent and Gemini Live API for voice interaction."""
 
 import asyncio
-from typing import Dict, Any, Optional, Callable, Awaitable
+import logging
+from typing import Dict, Any, List, Optional, Callable, Awaitable
 from langchain_core.messages import HumanMessage
 
 from src.v2_audio.voice_session import VoiceSession
 from src.v2_audio.config import VoiceConfig
 from src.v2.session import create_session
 
+logger = logging.getLogger(__name__)
+
 
 class AudioBridge:
     """Bridges text-based LangGraph agent with voice-enabled Live API."""
@@ -37,6 +40,9 @@ class AudioBridge:
         self.on_audio_output: Optional[Callable[[bytes], Awaitable[None]]] = None
         self.on_transcription: Optional[Callable[[str, str], Awaitable[None]]] = None
         self.on_agent_text: Optional[Callable[[str], Awaitable[None]]] = None
+        
+        # Input transcript fragments of the utterance in progress
+        self._pending_user_text: List[str] = []
     
     async def initialize(self):
         """Initialize both agent and voice session."""
@@ -56,15 +62,9 @@ class AudioBridge:
         current_state = self.graph.get_state(self.config_run)
         self.agent_state = current_state.values
         
-        # Extract last AI message (the question)
-        messages = self.agent_state.get("messages", [])
-        question = None
-        
-        for msg in reversed(messages):
-            msg_type = getattr(msg, "type", None) or getattr(msg, "role", None) or msg.__dict__.get("type")
-            if msg_type == "ai":
-                question = getattr(msg, "content", "") or getattr(msg, "text", "")
-                break
+        # Extract last AI message (the question); ask/clarify record its index
+        idx = self.agent_state.get("last_ai_message_idx")
+        question = self.agent_state["messages"][idx].content if idx is not None else None
         
         if question:
             # Notify callback with text (always show text even if audio fails)
@@ -77,9 +77,9 @@ class AudioBridge:
                 await self.voice_session.send_text(question, turn_complete=True)
                 
                 # Listen for audio output from Live API (with timeout per message)
-                import asyncio
                 timeout = 15.0  # Give more time for audio response
-                start_time = asyncio.get_event_loop().time()
+                loop = asyncio.get_running_loop()
+                start_time = loop.time()
                 
                 try:
                     response_count = 0
@@ -87,16 +87,15 @@ class AudioBridge:
                         response_count += 1
                         
                         # Check timeout
-                        elapsed = asyncio.get_event_loop().time() - start_time
+                        elapsed = loop.time() - start_time
                         if elapsed > timeout:
                             # Only break if we've been waiting a long time
                             break
                         
                         response_type = response.get("type", "unknown")
                         
-                        # Debug: Show what we're receiving
-                        if response_type != "unknown":
-                            print(f"📥 Received: {response_type}", end="", flush=True)
+                        # Debug: Show what we're receiving (per chunk, so not printed)
+                        logger.debug("Received from Live API: %s", response_type)
                         
                         if response_type == "audio_output":
                             # Play audio
@@ -104,21 +103,16 @@ class AudioBridge:
                             if audio_data and len(audio_data) > 0:
                                 if self.on_audio_output:
                                     await self.on_audio_output(audio_data)
-                                print(" ✅")
                             else:
-                                print(" ⚠️  (no audio data)")
+                                logger.debug("Audio output without audio data")
                         elif response_type == "output_transcription":
                             # Show transcription word-by-word (like the original working version)
                             transcription_text = response.get("text", "")
                             if transcription_text and self.on_transcription:
                                 await self.on_transcription("output", transcription_text)
-                            print(" (transcription)")
                         elif response_type == "interrupted":
                             # User interrupted
-                            print(" (interrupted)")
                             break
-                        else:
-                            print(f" (type: {response_type})")
                         
                         # Don't break immediately - let Live API finish speaking
                         # Only break on timeout or interruption
@@ -130,8 +124,6 @@ class AudioBridge:
                     print(f"\n⚠️  Error receiving from Live API: {e}")
                     import traceback
                     traceback.print_exc()
-                except Exception as e:
-                    print(f"⚠️  Error receiving from Live API: {e}")
             except Exception as e:
                 print(f"⚠️  Error sending to Live API: {e}")
                 print("   Continuing with text-only mode...")
@@ -147,22 +139,41 @@ class AudioBridge:
         # Run agent to process and get next question
         await self._run_agent_until_question()
     
+    def _utterance_done(self, response: Dict[str, Any]) -> bool:
+        """Buffer input transcript fragments; True once the utterance is complete.
+        
+        It is complete when a fragment is marked finished, or when the turn
+        ends with fragments still buffered.
+        """
+        if response["type"] == "input_transcription":
+            self._pending_user_text.append(response.get("text") or "")
+            if response.get("finished"):
+                return True
+        return bool(self._pending_user_text and response.get("turn_complete"))
+    
+    async def _submit_utterance(self):
+        """Send the buffered utterance to the agent as one message."""
+        user_text = " ".join("".join(self._pending_user_text).split())
+        self._pending_user_text.clear()
+        if not user_text:
+            return
+        
+        # Notify transcription callback
+        if self.on_transcription:
+            await self.on_transcription("input", user_text)
+        
+        # Process through agent
+        await self.process_user_input(user_text)
+    
     async def process_user_audio(self, audio_data: bytes):
         """Process user audio: send to Live API for transcription, then to agent."""
         # Send audio to Live API
         await self.voice_session.send_audio(audio_data, self.voice_config.input_sample_rate)
         
-        # Wait for transcription
+        # Wait for the complete transcription
         async for response in self.voice_session.receive():
-            if response["type"] == "input_transcription":
-                user_text = response["text"]
-                
-                # Notify transcription callback
-                if self.on_transcription:
-                    await self.on_transcription("input", user_text)
-                
-                # Process through agent
-                await self.process_user_input(user_text)
+            if self._utterance_done(response):
+                await self._submit_utterance()
                 break
     
     async def listen_and_process(self):
@@ -170,16 +181,11 @@ class AudioBridge:
         async for response in self.voice_session.receive():
             response_type = response["type"]
             
-            if response_type == "input_transcription":
-                # User spoke - process through agent
-                user_text = response["text"]
-                
-                if self.on_transcription:
-                    await self.on_transcription("input", user_text)
-                
-                await self.process_user_input(user_text)
+            if self._utterance_done(response):
+                # User finished speaking - process through agent
+                await self._submit_utterance()
             
-            elif response_type == "audio_output":
+            if response_type == "audio_output":
                 # Agent audio response - play it
                 audio_data = response["audio"]
                 
@@ -2,7 +2,12 @@
 
 import asyncio
 import queue
-from typing import Optional, Callable, Awaitable
+import threading
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache
+from math import gcd
+from typing import Optional, Callable, Awaitable, Tuple
 import numpy as np
 
 try:
@@ -12,16 +17,63 @@ except ImportError:
     PYAUDIO_AVAILABLE = False
     pyaudio = None
 
+try:
+    import soxr
+    SOXR_AVAILABLE = True
+except ImportError:
+    SOXR_AVAILABLE = False
+    soxr = None
+
+try:
+    from scipy.signal import resample_poly
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+    resample_poly = None
+
+
+# Blocking audio reads from `AudioCapture.read_async` run here rather than in
+# the default executor, so they don't queue behind graph runs or other I/O
+_AUDIO_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="audio-io")
+
+
+def _device_sample_rate(audio, device_index: Optional[int], input: bool) -> int:
+    """Default sample rate of a device (or of the host's default device)."""
+    if device_index is not None:
+        info = audio.get_device_info_by_index(device_index)
+    elif input:
+        info = audio.get_default_input_device_info()
+    else:
+        info = audio.get_default_output_device_info()
+    return int(info["defaultSampleRate"])
+
 
 class AudioCapture:
-    """Captures audio from microphone in real-time."""
+    """Captures audio from microphone in real-time.
+    
+    With `native_rate`, the stream is opened at the device's default rate
+    and each chunk is resampled to `sample_rate` in one explicit step,
+    instead of leaving the conversion to the host audio API.
+    
+    Chunks are buffered in a bounded deque (`max_queued_chunks`, oldest dropped
+    first) so the realtime callback takes no locks beyond one Event.set. The
+    callback stores the device's raw bytes; resampling happens in
+    `read_chunk`, on the consumer's thread.
+    
+    `read_async` runs its blocking read on `executor`, by default a small
+    shared pool; pass one per session when running several voice sessions
+    in one process.
+    """
     
     def __init__(
         self,
         sample_rate: int = 16000,
         chunk_size: int = 1024,
         channels: int = 1,
-        device_index: Optional[int] = None
+        device_index: Optional[int] = None,
+        native_rate: bool = False,
+        max_queued_chunks: int = 256,
+        executor: Optional[Executor] = None
     ):
         """Initialize audio capture."""
         if not PYAUDIO_AVAILABLE:
@@ -34,47 +86,84 @@ class AudioCapture:
         self.chunk_size = chunk_size
         self.channels = channels
         self.device_index = device_index
+        self.native_rate = native_rate
+        self.stream_rate = sample_rate
+        self.executor = executor or _AUDIO_EXECUTOR
         
         self.audio = pyaudio.PyAudio()
         self.stream: Optional[pyaudio.Stream] = None
         self.is_recording = False
-        self.audio_queue = queue.Queue()
+        # deque append/popleft are atomic, so no lock is needed around them
+        self._chunks: deque = deque(maxlen=max_queued_chunks)
+        self._data_ready = threading.Event()
+        self._resampler: Optional[Resampler] = None
     
     def start(self):
         """Start audio capture stream."""
         if self.stream:
             return
         
+        if self.native_rate:
+            self.stream_rate = _device_sample_rate(self.audio, self.device_index, input=True)
+        
         self.stream = self.audio.open(
             format=pyaudio.paInt16,
             channels=self.channels,
-            rate=self.sample_rate,
+            rate=self.stream_rate,
             input=True,
             input_device_index=self.device_index,
-            frames_per_buffer=self.chunk_size,
+            # Keep the chunk duration the same at the device rate
+            frames_per_buffer=self.chunk_size * self.stream_rate // self.sample_rate,
             stream_callback=self._audio_callback
         )
         
+        if self.stream_rate != self.sample_rate:
+            # Low-latency quality on the capture path
+            self._resampler = Resampler(
+                self.stream_rate, self.sample_rate, self.channels, quality="QQ"
+            )
+        
         self.is_recording = True
         self.stream.start_stream()
     
     def _audio_callback(self, in_data, frame_count, time_info, status):
         """Callback for audio stream."""
         if self.is_recording:
-            self.audio_queue.put(in_data)
+            self._chunks.append(in_data)
+            self._data_ready.set()
         return (None, pyaudio.paContinue)
     
     def read_chunk(self, timeout: float = 0.1) -> Optional[bytes]:
-        """Read a chunk of audio data."""
+        """Read a chunk of audio data (at `sample_rate`)."""
+        chunk = self._next_chunk(timeout)
+        if chunk is not None and self._resampler is not None:
+            chunk = self._resampler.process(chunk).tobytes()
+        return chunk
+    
+    def _next_chunk(self, timeout: float) -> Optional[bytes]:
+        """Pop the oldest captured chunk, waiting up to `timeout` for one."""
         try:
-            return self.audio_queue.get(timeout=timeout)
-        except queue.Empty:
+            return self._chunks.popleft()
+        except IndexError:
+            pass
+        
+        self._data_ready.clear()
+        # Check again: a chunk may have arrived before the clear
+        try:
+            return self._chunks.popleft()
+        except IndexError:
+            pass
+        
+        if not self._data_ready.wait(timeout):
+            return None
+        try:
+            return self._chunks.popleft()
+        except IndexError:
             return None
     
     async def read_async(self) -> Optional[bytes]:
         """Read audio chunk asynchronously."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.read_chunk)
+        return await asyncio.get_running_loop().run_in_executor(self.executor, self.read_chunk)
     
     def stop(self):
         """Stop audio capture."""
@@ -92,15 +181,29 @@ class AudioCapture:
             self.audio = None
 
 
+# Queued by `AudioPlayback.clear` so the writer thread, the only user of the
+# playback resampler, resets it between chunks
+_RESET_RESAMPLER = object()
+
+
 class AudioPlayback:
-    """Plays audio to speaker in real-time."""
+    """Plays audio to speaker in real-time.
+    
+    `enqueue` and `play_async` hand chunks to a writer thread that feeds the
+    blocking PortAudio stream, so a network receive loop never waits on
+    playback and no executor thread is held.
+    With `native_rate`, the stream runs at the device's default rate and
+    chunks are resampled from `sample_rate` before being written.
+    """
     
     def __init__(
         self,
         sample_rate: int = 24000,
         chunk_size: int = 1024,
         channels: int = 1,
-        device_index: Optional[int] = None
+        device_index: Optional[int] = None,
+        max_queued_chunks: int = 256,
+        native_rate: bool = False
     ):
         """Initialize audio playback."""
         if not PYAUDIO_AVAILABLE:
@@ -113,36 +216,106 @@ class AudioPlayback:
         self.chunk_size = chunk_size
         self.channels = channels
         self.device_index = device_index
+        self.native_rate = native_rate
+        self.stream_rate = sample_rate
+        self.max_queued_chunks = max_queued_chunks
         
         self.audio = pyaudio.PyAudio()
         self.stream: Optional[pyaudio.Stream] = None
+        # Unbounded, so a put never blocks; `enqueue` applies the bound itself.
+        # Holds chunks, plus the None stop and resampler-reset sentinels
+        self.play_queue: "queue.SimpleQueue[object]" = queue.SimpleQueue()
+        self._writer: Optional[threading.Thread] = None
+        self._resampler: Optional[Resampler] = None
     
     def start(self):
         """Start audio playback stream."""
         if self.stream:
             return
         
+        if self.native_rate:
+            self.stream_rate = _device_sample_rate(self.audio, self.device_index, input=False)
+        
         self.stream = self.audio.open(
             format=pyaudio.paInt16,
             channels=self.channels,
-            rate=self.sample_rate,
+            rate=self.stream_rate,
             output=True,
             output_device_index=self.device_index,
             frames_per_buffer=self.chunk_size
         )
+        
+        if self.stream_rate != self.sample_rate:
+            self._resampler = Resampler(
+                self.sample_rate, self.stream_rate, self.channels, quality="HQ"
+            )
+        
+        self._writer = threading.Thread(
+            target=self._write_loop,
+            name="audio-playback",
+            daemon=True
+        )
+        self._writer.start()
+    
+    def _write_loop(self):
+        """Drain queued chunks into the stream until the stop sentinel."""
+        while True:
+            audio_data = self.play_queue.get()
+            if audio_data is None:
+                return
+            if audio_data is _RESET_RESAMPLER:
+                self._resampler.reset()
+                continue
+            self.play(audio_data)
+    
+    def enqueue(self, audio_data: bytes) -> bool:
+        """Queue audio for playback without blocking.
+        
+        Returns False (dropping the chunk) if `max_queued_chunks` are queued.
+        """
+        if self.play_queue.qsize() >= self.max_queued_chunks:
+            return False
+        self.play_queue.put(audio_data)
+        return True
+    
+    def clear(self):
+        """Drop audio that has been queued but not yet played."""
+        try:
+            while True:
+                self.play_queue.get_nowait()
+        except queue.Empty:
+            pass
+        if self._resampler is not None:
+            # Don't let the tail of dropped audio bleed into what plays next.
+            # soxr streams aren't thread-safe, so a running writer resets it
+            if self._writer is not None:
+                self.play_queue.put(_RESET_RESAMPLER)
+            else:
+                self._resampler.reset()
     
     def play(self, audio_data: bytes):
         """Play audio data."""
         if self.stream:
+            if self._resampler is not None:
+                audio_data = _as_frames(self._resampler.process(audio_data))
             self.stream.write(audio_data)
     
     async def play_async(self, audio_data: bytes):
-        """Play audio data asynchronously."""
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, self.play, audio_data)
+        """Queue audio for the writer thread; O(1), never blocks.
+        
+        Unlike `enqueue`, nothing is dropped, so the queue can grow past
+        `max_queued_chunks`. Only the writer thread writes to the stream,
+        so chunks play in order and share one resampler.
+        """
+        self.play_queue.put(audio_data)
     
     def stop(self):
         """Stop audio playback."""
+        if self._writer:
+            self.clear()
+            self.play_queue.put(None)
+            self._writer.join()
+            self._writer = None
         if self.stream:
             self.stream.stop_stream()
             self.stream.close()
@@ -156,43 +329,162 @@ class AudioPlayback:
             self.audio = None
 
 
-def convert_sample_rate(
+@lru_cache(maxsize=16)
+def _poly_factors(input_rate: int, output_rate: int) -> Tuple[int, int]:
+    """(up, down) factors for polyphase resampling between two rates."""
+    g = gcd(input_rate, output_rate)
+    return output_rate // g, input_rate // g
+
+
+_INTERP_BITS = 14
+
+
+@lru_cache(maxsize=16)
+def _interp_table(length: int, new_length: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Neighbour indices and fixed-point weights for linear interpolation.
+    
+    Chunks come in a few fixed sizes, so this is computed once per size and
+    each chunk is then two gathers and a multiply-add in int32.
+    """
+    positions = np.linspace(0, length - 1, new_length)
+    left = positions.astype(np.intp)
+    right = np.minimum(left + 1, length - 1)
+    w_right = np.rint((positions - left) * (1 << _INTERP_BITS)).astype(np.int32)
+    w_left = (1 << _INTERP_BITS) - w_right
+    return left, right, w_left, w_right
+
+
+def _resample(
     audio_data: bytes,
     input_rate: int,
     output_rate: int,
-    channels: int = 1
-) -> bytes:
-    """Convert audio sample rate (simple linear interpolation)."""
-    if input_rate == output_rate:
-        return audio_data
-    
-    # Convert bytes to numpy array
+    channels: int = 1,
+    quality: str = "HQ"
+) -> np.ndarray:
+    """Resample int16 PCM into a new int16 array."""
+    # View the buffer in place; no copy of the input
     audio_array = np.frombuffer(audio_data, dtype=np.int16)
     
     # Reshape if stereo
     if channels > 1:
         audio_array = audio_array.reshape(-1, channels)
     
+    if SOXR_AVAILABLE:
+        return soxr.resample(audio_array, input_rate, output_rate, quality=quality)
+    
+    if SCIPY_AVAILABLE:
+        up, down = _poly_factors(input_rate, output_rate)
+        resampled = resample_poly(audio_array, up, down, axis=0)
+        # The FIR filter can overshoot full scale; clip rather than wrap
+        return np.clip(resampled, -32768, 32767).astype(np.int16)
+    
     # Calculate resampling ratio
     ratio = output_rate / input_rate
     new_length = int(len(audio_array) * ratio)
     
-    # Simple linear interpolation (for production, use scipy.signal.resample)
-    indices = np.linspace(0, len(audio_array) - 1, new_length)
-    resampled = np.interp(indices, np.arange(len(audio_array)), audio_array)
+    # Simple linear interpolation, in integer arithmetic
+    left, right, w_left, w_right = _interp_table(len(audio_array), new_length)
+    if channels > 1:
+        w_left, w_right = w_left[:, None], w_right[:, None]
+    resampled = audio_array[left] * w_left + audio_array[right] * w_right
+    
+    # Round and convert back to int16
+    return ((resampled + (1 << (_INTERP_BITS - 1))) >> _INTERP_BITS).astype(np.int16)
+
+
+class Resampler:
+    """Resamples a stream of int16 PCM chunks between two fixed rates.
+    
+    With soxr, one `ResampleStream` is set up per rate pair and its filter
+    state carries over from chunk to chunk, so there are no seams at chunk
+    boundaries (output lags input by the filter delay). Without soxr each
+    chunk is resampled on its own, as `convert_sample_rate` does.
+    """
+    
+    def __init__(
+        self,
+        input_rate: int,
+        output_rate: int,
+        channels: int = 1,
+        quality: str = "HQ"
+    ):
+        self.input_rate = input_rate
+        self.output_rate = output_rate
+        self.channels = channels
+        self.quality = quality
+        self._stream = None
+        self.reset()
     
-    # Convert back to int16
-    resampled = resampled.astype(np.int16)
+    def reset(self) -> None:
+        """Drop buffered filter state, e.g. after skipping audio."""
+        if SOXR_AVAILABLE:
+            self._stream = soxr.ResampleStream(
+                self.input_rate, self.output_rate, self.channels,
+                dtype="int16", quality=self.quality
+            )
+    
+    def process(self, audio_data: bytes) -> np.ndarray:
+        """Resample one chunk into a new int16 array."""
+        stream = self._stream
+        if stream is None:
+            return _resample(
+                audio_data, self.input_rate, self.output_rate, self.channels, self.quality
+            )
+        
+        audio_array = np.frombuffer(audio_data, dtype=np.int16)
+        if self.channels > 1:
+            audio_array = audio_array.reshape(-1, self.channels)
+        return stream.resample_chunk(audio_array)
+
+
+def _as_frames(audio_array: np.ndarray) -> memoryview:
+    """Expose an int16 array as read-only bytes without copying.
+    
+    PyAudio's `Stream.write` wants a read-only buffer whose length is in
+    bytes, which a byte-cast view of a frozen array satisfies.
+    """
+    audio_array.flags.writeable = False
+    return memoryview(audio_array).cast("B")
+
+
+def convert_sample_rate(
+    audio_data: bytes,
+    input_rate: int,
+    output_rate: int,
+    channels: int = 1,
+    quality: str = "HQ"
+) -> bytes:
+    """Convert audio sample rate.
+    
+    Uses soxr when installed (`quality` is a soxr preset such as "QQ" or
+    "HQ"), then scipy's polyphase filter, and falls back to linear
+    interpolation otherwise.
+    """
+    if input_rate == output_rate:
+        return audio_data
+    
+    return _resample(audio_data, input_rate, output_rate, channels, quality).tobytes()
+
+
+def list_audio_devices(force_refresh: bool = False) -> list:
+    """List available audio input/output devices.
     
-    # Convert back to bytes
-    return resampled.tobytes()
+    Enumerating means initializing PortAudio, which can take a while on
+    some hosts, so the result is cached; `force_refresh` enumerates again
+    (e.g. after plugging in a headset).
+    """
+    if force_refresh:
+        _enumerate_devices.cache_clear()
+    return [dict(device) for device in _enumerate_devices()]
 
 
-def list_audio_devices() -> list:
-    """List available audio input/output devices."""
+@lru_cache(maxsize=1)
+def _enumerate_devices() -> tuple:
     if not PYAUDIO_AVAILABLE:
-        return []
+        return ()
     
+    # A fresh PyAudio each time: PortAudio only sees devices present when
+    # it was initialized
     audio = pyaudio.PyAudio()
     devices = []
     
@@ -207,5 +499,5 @@ def list_audio_devices() -> list:
         })
     
     audio.terminate()
-    return devices
+    return tuple(devices)
 
@@ -94,7 +94,7 @@ async def run_voice_cli(form_id: str, mode: str, voice_config: VoiceConfig):
     
     # Audio output callback
     async def on_audio_output(audio_data: bytes):
-        await audio_playback.play_async(audio_data)
+        audio_playback.enqueue(audio_data)
     
     # Agent text callback
     async def on_agent_text(text: str):
@@ -147,10 +147,10 @@ async def run_voice_cli(form_id: str, mode: str, voice_config: VoiceConfig):
                 
                 elif response_type == "audio_output":
                     # Agent audio - play it
-                    audio_data = response["audio"]
-                    await audio_playback.play_async(audio_data)
+                    audio_playback.enqueue(response["audio"])
                 
                 elif response_type == "interrupted":
+                    audio_playback.clear()
                     print("⚠️  You interrupted the agent")
             
             except asyncio.TimeoutError:
@@ -184,6 +184,7 @@ async def run_voice_cli(form_id: str, mode: str, voice_config: VoiceConfig):
         
         csv_handler = CSVOutputHandler()
         csv_path = csv_handler.save(collected)
+        csv_handler.close()
         print(f"✅ Appended to CSV: {csv_path}")
     
     except KeyboardInterrupt:
@@ -153,6 +153,7 @@ class VoiceSession:
             # Check for audio output
             if hasattr(response, "server_content") and response.server_content:
                 sc = response.server_content
+                result["turn_complete"] = bool(getattr(sc, "turn_complete", False))
                 
                 # Audio output - check multiple possible locations
                 audio_found = False
@@ -188,6 +189,8 @@ class VoiceSession:
                 if hasattr(sc, "input_transcription") and sc.input_transcription:
                     result["type"] = "input_transcription"
                     result["text"] = sc.input_transcription.text
+                    # Transcripts arrive in fragments; the last one is marked finished
+                    result["finished"] = bool(getattr(sc.input_transcription, "finished", False))
                 
                 # Output transcription (agent speech)
                 if hasattr(sc, "output_transcription") and sc.output_transcription:
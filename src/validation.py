@@ -4,6 +4,10 @@ import re
 from typing import Dict, Any, Tuple
 
 
+_EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w{2,}')
+_NON_DIGIT_RE = re.compile(r'\D')
+
+
 def validate_value(value: Any, field: Dict[str, Any]) -> Dict[str, Any]:
     """Validate extracted value against field requirements."""
     errors = []
@@ -38,15 +42,14 @@ def validate_value(value: Any, field: Dict[str, Any]) -> Dict[str, Any]:
 
 def validate_email(value: Any, field: Dict[str, Any]) -> Tuple[bool, list]:
     """Validate email format."""
-    pattern = r'^[\w\.-]+@[\w\.-]+\.\w{2,}$'
-    if re.match(pattern, str(value)):
+    if _EMAIL_RE.fullmatch(str(value)):
         return True, []
     return False, ["Please provide a valid email address"]
 
 
 def validate_phone(value: Any, field: Dict[str, Any]) -> Tuple[bool, list]:
     """Validate phone number format."""
-    digits = re.sub(r'\D', '', str(value))
+    digits = _NON_DIGIT_RE.sub('', str(value))
     if len(digits) >= 10:
         return True, []
     return False, ["Please provide a 10-digit phone number"]
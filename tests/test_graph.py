@@ -41,6 +41,13 @@ class TestGraphCreation:
         # Graph should be compiled and have an invoke method
         assert hasattr(graph, "invoke")
         assert hasattr(graph, "stream")
+    
+    def test_graphs_keep_their_own_checkpointer(self):
+        from langgraph.checkpoint.memory import MemorySaver
+        first, second = MemorySaver(), MemorySaver()
+        assert create_intake_graph(checkpointer=first).checkpointer is first
+        assert create_intake_graph(checkpointer=second).checkpointer is second
+        assert create_intake_graph().checkpointer is None
 
 
 class TestGraphExecution:
@@ -0,0 +1,84 @@
+"""Tests for the LLM response cache."""
+
+import pytest
+from src.llm_cache import LLMCache, MemoryBackend
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = LLMCache(str(tmp_path / "llm_cache"))
+    yield cache
+    cache.close()
+
+
+class TestCacheKey:
+    def test_key_is_deterministic(self):
+        messages = [("human", "What is your name?")]
+        key1 = LLMCache.cache_key("gemini-2.5-pro", messages, 0.0)
+        key2 = LLMCache.cache_key("gemini-2.5-pro", messages, 0.0)
+        assert key1 == key2
+    
+    def test_key_depends_on_model_and_temperature(self):
+        messages = [("human", "prompt")]
+        base = LLMCache.cache_key("gemini-2.5-pro", messages, 0.0)
+        assert base != LLMCache.cache_key("gemini-2.5-flash", messages, 0.0)
+        assert base != LLMCache.cache_key("gemini-2.5-pro", messages, 0.3)
+    
+    def test_key_depends_on_message_roles(self):
+        as_human = LLMCache.cache_key("gemini-2.5-pro", [("human", "prompt")], 0.0)
+        as_system = LLMCache.cache_key("gemini-2.5-pro", [("system", "prompt")], 0.0)
+        assert as_human != as_system
+
+
+class TestMemoryBackend:
+    def test_set_and_get(self):
+        backend = MemoryBackend()
+        backend.set("key", "value")
+        assert backend.get("key") == "value"
+    
+    def test_evicts_least_recently_used(self):
+        backend = MemoryBackend(maxsize=2)
+        backend.set("a", "1")
+        backend.set("b", "2")
+        backend.get("a")
+        backend.set("c", "3")
+        assert backend.get("a") == "1"
+        assert backend.get("b") is None
+    
+    def test_expired_entry(self):
+        backend = MemoryBackend()
+        backend.set("key", "stale", ttl=-1)
+        assert backend.get("key") is None
+
+
+class TestLLMCache:
+    def test_get_missing_key(self, cache):
+        assert cache.get("missing") is None
+    
+    def test_set_and_get(self, cache):
+        cache.set("key", "What is your email address?")
+        assert cache.get("key") == "What is your email address?"
+    
+    def test_expired_entry(self, cache):
+        cache.set("key", "stale", ttl=-1)
+        assert cache.get("key") is None
+    
+    def test_persists_across_instances(self, tmp_path):
+        directory = str(tmp_path / "llm_cache")
+        first = LLMCache(directory)
+        first.set("key", "cached")
+        first.close()
+        
+        second = LLMCache(directory)
+        assert second.get("key") == "cached"
+        second.close()
+    
+    def test_clear(self, cache):
+        cache.set("key", "value")
+        cache.clear()
+        assert cache.get("key") is None
+    
+    def test_memory_backend_instance(self):
+        cache = LLMCache(backend=MemoryBackend())
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
@@ -4,14 +4,24 @@ import pytest
 from src.modes import (
     ask_speed,
     process_speed,
+    process_exact,
+    process_quality,
     extract_email,
     extract_phone,
+    extract_date,
     extract_boolean,
     extract_select,
     annotate_speed,
     clarify_speed,
+    CachedLLM,
+    get_llm_cache,
+    precompute_prompt_fragments,
+    _speed_question,
 )
 from src.config import AgentConfig
+from src.llm_cache import LLMCache, MemoryBackend
+from src.types import ExtractionResult
+from langchain_core.messages import HumanMessage
 
 
 class TestAskSpeed:
@@ -35,6 +45,14 @@ class TestAskSpeed:
         question = ask_speed(field, {})
         assert "Country" in question
         assert "USA" in question or "Canada" in question
+    
+    def test_precomputed_question_is_reused(self):
+        field = {"field_type": "phone", "label": "Work phone"}
+        precompute_prompt_fragments({"fields": [field]})
+        hits = _speed_question.cache_info().hits
+        question = ask_speed(dict(field), {})
+        assert "Work phone" in question
+        assert _speed_question.cache_info().hits == hits + 1
 
 
 class TestExtractEmail:
@@ -59,6 +77,20 @@ class TestExtractPhone:
         assert "555" in result
 
 
+class TestExtractDate:
+    def test_extract_date_iso(self):
+        assert extract_date("2024-01-15", {}) == "2024-01-15"
+    
+    def test_extract_date_us_format(self):
+        assert extract_date(" 1/5/2024 ", {}) == "2024-01-05"
+    
+    def test_extract_date_falls_back_to_dateutil(self):
+        assert extract_date("Jan 15 2024", {}) == "2024-01-15"
+    
+    def test_extract_date_unparseable_returns_text(self):
+        assert extract_date(" not a date ", {}) == "not a date"
+
+
 class TestExtractBoolean:
     def test_extract_boolean_yes(self):
         assert extract_boolean("yes", {}) is True
@@ -84,6 +116,14 @@ class TestExtractSelect:
         field = {"options": ["United States", "Canada"]}
         result = extract_select("usa", field)
         assert "United States" in result or result == "usa"
+    
+    def test_extract_select_exact_match_ignores_case(self):
+        field = {"options": ["Part-time", "Full-time"]}
+        assert extract_select("  FULL-TIME ", field) == "Full-time"
+    
+    def test_extract_select_prefers_exact_over_fuzzy(self):
+        field = {"options": ["Senior Manager", "Manager"]}
+        assert extract_select("manager", field) == "Manager"
 
 
 class TestProcessSpeed:
@@ -105,6 +145,26 @@ class TestProcessSpeed:
         assert result["value"] is True
 
 
+class TestProcessExact:
+    def test_exact_email(self):
+        field = {"field_type": "email"}
+        result = process_exact(" john@example.com ", field)
+        assert result["value"] == "john@example.com"
+        assert result["extraction_method"] == "regex"
+    
+    def test_exact_phone_is_formatted(self):
+        field = {"field_type": "phone"}
+        result = process_exact("555.123.4567", field)
+        assert result["value"] == "(555) 123-4567"
+    
+    def test_free_form_answer_needs_llm(self):
+        assert process_exact("thirty years old", {"field_type": "number"}) is None
+        assert process_exact("it's john@example.com", {"field_type": "email"}) is None
+    
+    def test_text_field_needs_llm(self):
+        assert process_exact("John Doe", {"field_type": "text"}) is None
+
+
 class TestAnnotateSpeed:
     def test_annotate_uncertainty(self):
         notes = annotate_speed("I think it's around 100")
@@ -121,6 +181,19 @@ class TestAnnotateSpeed:
     def test_annotate_external_reference(self):
         notes = annotate_speed("See attached document")
         assert any("external" in note.lower() or "document" in note.lower() for note in notes)
+    
+    def test_annotate_notes_first_uncertainty_by_priority(self):
+        notes = annotate_speed("Not sure, around 100")
+        assert notes == ["Approximate value provided"]
+    
+    def test_annotate_combines_categories(self):
+        notes = annotate_speed("Maybe, if the document is current as of today")
+        assert notes == [
+            "Response contains uncertainty",
+            "Response contains conditional language",
+            "Response may be time-sensitive",
+            "References external document",
+        ]
 
 
 class TestClarifySpeed:
@@ -136,4 +209,114 @@ class TestClarifySpeed:
         message = clarify_speed(field, errors, 1)
         assert "required" in message.lower()
         assert "Name" in message
+    
+    def test_clarify_select_lists_options(self):
+        field = {"field_type": "select", "label": "Plan", "options": ["Basic", "Pro"]}
+        message = clarify_speed(field, ["Please select a valid option"], 1)
+        assert message == "Please choose from: Basic, Pro"
+    
+    def test_clarify_unmatched_error_uses_default(self):
+        field = {"field_type": "text", "label": "Name"}
+        message = clarify_speed(field, ["Too short"], 1)
+        assert message == "Please provide a valid Name"
+
+
+class _FakeStructuredLLM:
+    """Counts calls; returns a fixed extraction."""
+    
+    def __init__(self):
+        self.calls = 0
+        self.bindings = 0
+    
+    def with_structured_output(self, schema, **kwargs):
+        self.bindings += 1
+        return self
+    
+    def invoke(self, messages, **kwargs):
+        self.calls += 1
+        return ExtractionResult(value="John", confidence=0.9)
+
+
+class TestCachedLLMStructuredOutput:
+    def test_structured_response_is_cached(self):
+        fake = _FakeStructuredLLM()
+        cache = LLMCache(backend=MemoryBackend())
+        llm = CachedLLM(fake, cache, "model", 0.0).with_structured_output(ExtractionResult)
+        messages = [HumanMessage(content="My name is John")]
+        
+        first = llm.invoke(messages)
+        second = llm.invoke(messages)
+        
+        assert fake.calls == 1
+        assert isinstance(second, ExtractionResult)
+        assert second == first
+    
+    def test_structured_and_plain_keys_differ(self):
+        cache = LLMCache(backend=MemoryBackend())
+        plain = CachedLLM(_FakeStructuredLLM(), cache, "model", 0.0)
+        structured = plain.with_structured_output(ExtractionResult)
+        messages = [HumanMessage(content="My name is John")]
+        assert plain._key(messages) != structured._key(messages)
+    
+    def test_schema_is_bound_once_per_model(self):
+        fake = _FakeStructuredLLM()
+        plain = CachedLLM(fake, LLMCache(backend=MemoryBackend()), "model", 0.0)
+        plain.with_structured_output(ExtractionResult)
+        plain.with_structured_output(ExtractionResult)
+        assert fake.bindings == 1
+
+
+class TestGetLLMCache:
+    def test_configs_with_different_backends_get_different_caches(self, tmp_path):
+        memory = AgentConfig(cache_enabled=True, cache_backend="memory")
+        sqlite = AgentConfig(cache_enabled=True, cache_dir=str(tmp_path))
+        assert get_llm_cache(memory) is not get_llm_cache(sqlite)
+        assert isinstance(get_llm_cache(memory).backend, MemoryBackend)
+    
+    def test_configs_with_same_settings_share_a_cache(self):
+        speed = AgentConfig(default_mode="speed", cache_enabled=True, cache_backend="memory")
+        quality = AgentConfig(default_mode="quality", cache_enabled=True, cache_backend="memory")
+        assert get_llm_cache(speed) is get_llm_cache(quality)
+    
+    def test_deterministic_config_caches_in_memory_only(self, tmp_path):
+        config = AgentConfig(llm_temperature=0, cache_dir=str(tmp_path))
+        assert isinstance(get_llm_cache(config).backend, MemoryBackend)
+        assert get_llm_cache(AgentConfig(llm_temperature=0.3)) is None
 
+
+class TestExtractionCache:
+    @pytest.fixture
+    def fake_llm(self, monkeypatch):
+        fake = _FakeStructuredLLM()
+        monkeypatch.setattr("src.modes.get_structured_llm", lambda config, schema: fake)
+        monkeypatch.setattr("src.modes._extractions", MemoryBackend())
+        return fake
+    
+    def test_repeated_answer_hits(self, fake_llm):
+        config = AgentConfig(default_mode="quality", cache_enabled=True)
+        field = {"id": "name", "field_type": "text", "label": "Full Name"}
+        process_quality("My name is John", field, config)
+        result = process_quality("  my name is JOHN. ", field, config)
+        assert fake_llm.calls == 1
+        assert result["value"] == "John"
+        assert result["extraction_method"] == "cache"
+        assert result["raw"] == "  my name is JOHN. "
+    
+    def test_similar_answer_or_other_field_misses(self, fake_llm):
+        config = AgentConfig(default_mode="quality", cache_enabled=True)
+        field = {"id": "name", "field_type": "text", "label": "Full Name"}
+        process_quality("My name is John Smith", field, config)
+        result = process_quality("My name is Jon Smith", field, config)
+        assert fake_llm.calls == 2
+        assert result["extraction_method"] == "llm"
+        
+        other = {"id": "name", "field_type": "text", "label": "Preferred Name"}
+        process_quality("My name is John Smith", other, config)
+        assert fake_llm.calls == 3
+    
+    def test_disabled_without_cache_enabled(self, fake_llm):
+        config = AgentConfig(default_mode="quality")
+        field = {"id": "name", "field_type": "text", "label": "Full Name"}
+        process_quality("My name is John", field, config)
+        process_quality("My name is John", field, config)
+        assert fake_llm.calls == 2
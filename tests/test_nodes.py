@@ -1,7 +1,11 @@
 """Tests for node implementations."""
 
+import asyncio
+import contextvars
+
 import pytest
 from langchain_core.messages import HumanMessage, AIMessage
+from langchain_core.runnables import RunnableLambda
 from src.nodes import (
     ask_node,
     process_node,
@@ -12,6 +16,8 @@ from src.nodes import (
     route_validation,
     route_completion,
     set_config,
+    get_config,
+    _question_key,
 )
 from src.types import FormState
 from src.config import AgentConfig
@@ -56,6 +62,11 @@ class TestAskNode:
         last_message = state["messages"][-1]
         assert "Name" in last_message.content
 
+    def test_ask_node_records_last_ai_message_idx(self, initial_state):
+        state = ask_node(initial_state)
+        idx = state["last_ai_message_idx"]
+        assert state["messages"][idx] is state["messages"][-1]
+
 
 class TestProcessNode:
     def test_process_node_extracts_value(self, initial_state):
@@ -69,6 +80,13 @@ class TestProcessNode:
         initial_state["messages"].append(HumanMessage(content=user_input))
         state = process_node(initial_state)
         assert state["collected_fields"]["name"]["raw"] == user_input
+    
+    def test_process_node_returns_only_the_changed_entry(self, initial_state):
+        initial_state["collected_fields"] = {"email": {"value": "john@example.com"}}
+        initial_state["messages"].append(HumanMessage(content="John Doe"))
+        state = process_node(initial_state)
+        assert list(state["collected_fields"]) == ["name"]
+        assert list(initial_state["collected_fields"]) == ["email"]
 
 
 class TestValidateNode:
@@ -88,6 +106,17 @@ class TestValidateNode:
         state = validate_node(initial_state)
         assert state["validation_result"]["valid"] is False
         assert len(state["validation_result"]["errors"]) > 0
+        assert "collected_fields" not in state
+    
+    def test_validate_node_notes_acceptance_after_max_attempts(self, initial_state):
+        initial_state["current_field_id"] = "email"
+        initial_state["clarification_count"] = 3
+        entry = {"value": "not-an-email", "raw": "not-an-email", "notes": []}
+        initial_state["collected_fields"] = {"email": entry}
+        state = validate_node(initial_state)
+        notes = state["collected_fields"]["email"]["notes"]
+        assert "max clarification attempts" in notes[0].lower()
+        assert entry["notes"] == []  # The checkpointed entry is not modified
 
 
 class TestClarifyNode:
@@ -126,6 +155,18 @@ class TestAnnotateNode:
         state = annotate_node(initial_state)
         notes = state["collected_fields"]["name"]["notes"]
         assert len(notes) > 0
+    
+    def test_annotate_node_does_not_repeat_notes(self, initial_state):
+        initial_state["collected_fields"] = {
+            "name": {
+                "value": "John",
+                "raw": "I think it's John",
+                "notes": ["Response contains uncertainty"]
+            }
+        }
+        state = annotate_node(initial_state)
+        notes = state["collected_fields"]["name"]["notes"]
+        assert notes == ["Response contains uncertainty"]
 
 
 class TestAdvanceNode:
@@ -169,7 +210,7 @@ class TestRouteValidation:
         }
         result = route_validation(initial_state)
         assert result == "accept_with_note"
-        assert "max clarification attempts" in initial_state["collected_fields"]["name"]["notes"][0].lower()
+        assert initial_state["collected_fields"]["name"]["notes"] == []
 
 
 class TestRouteCompletion:
@@ -183,3 +224,44 @@ class TestRouteCompletion:
         result = route_completion(initial_state)
         assert result == "continue"
 
+
+class TestConfigContext:
+    def test_set_config_is_scoped_to_context(self):
+        config = AgentConfig(default_mode="quality")
+        ctx = contextvars.copy_context()
+        ctx.run(set_config, config)
+        assert ctx.run(get_config) is config
+        assert get_config() is not config
+    
+    def test_concurrent_tasks_keep_their_own_config(self):
+        async def run(mode):
+            set_config(AgentConfig(default_mode=mode))
+            await asyncio.sleep(0)
+            return get_config().default_mode
+        
+        async def main():
+            return await asyncio.gather(run("speed"), run("quality"))
+        
+        assert asyncio.run(main()) == ["speed", "quality"]
+
+
+class TestQuestionKey:
+    def test_same_field_id_with_other_label_differs(self):
+        email = {"id": "contact", "field_type": "email", "label": "Email"}
+        phone = {"id": "contact", "field_type": "phone", "label": "Phone Number"}
+        assert _question_key(email, {}) != _question_key(phone, {})
+    
+    def test_sessions_get_their_own_keys(self):
+        field = {"id": "email", "field_type": "email", "label": "Email"}
+        key_in = RunnableLambda(lambda _: _question_key(field, {}))
+        first = key_in.invoke(None, {"configurable": {"thread_id": "a"}})
+        second = key_in.invoke(None, {"configurable": {"thread_id": "b"}})
+        assert first != second
+        assert first == key_in.invoke(None, {"configurable": {"thread_id": "a"}})
+    
+    def test_config_is_part_of_the_key(self):
+        field = {"id": "email", "field_type": "email", "label": "Email"}
+        ctx = contextvars.copy_context()
+        ctx.run(set_config, AgentConfig(default_mode="quality"))
+        assert ctx.run(_question_key, field, {}) != _question_key(field, {})
+
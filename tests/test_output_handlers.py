@@ -0,0 +1,198 @@
+"""Tests for output handlers."""
+
+import csv
+import json
+import sqlite3
+import threading
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pytest
+from src.output_handlers import (
+    JSONOutputHandler,
+    JSONLinesOutputHandler,
+    CSVOutputHandler,
+    DatabaseOutputHandler,
+    WebhookOutputHandler,
+)
+
+
+SAMPLE = {
+    "name": {"value": "John Doe", "notes": ["Response contains uncertainty"]},
+    "start_date": {"value": date(2024, 1, 15)},
+    "score": {"value": np.float32(0.5)},
+}
+
+
+class TestJSONOutputHandler:
+    def test_writes_readable_json(self, tmp_path):
+        path = JSONOutputHandler(str(tmp_path)).save(SAMPLE, metadata={"mode": "speed"})
+        with open(path) as f:
+            output = json.load(f)
+        assert output["data"]["name"]["value"] == "John Doe"
+        assert output["data"]["start_date"]["value"] == "2024-01-15"
+        assert output["data"]["score"]["value"] == 0.5
+        assert output["metadata"] == {"mode": "speed"}
+
+    def test_same_second_saves_get_distinct_files(self, tmp_path):
+        handler = JSONOutputHandler(str(tmp_path))
+        paths = [handler.save({"n": {"value": i}}) for i in range(3)]
+        assert len(set(paths)) == 3
+        values = []
+        for path in paths:
+            with open(path) as f:
+                values.append(json.load(f)["data"]["n"]["value"])
+        assert values == [0, 1, 2]
+
+
+class TestJSONLinesOutputHandler:
+    def test_appends_one_line_per_submission(self, tmp_path):
+        path = tmp_path / "submissions.jsonl"
+        handler = JSONLinesOutputHandler(str(path))
+        handler.save(SAMPLE)
+        handler.save({"name": {"value": "Jane"}}, metadata={"mode": "speed"})
+        handler.close()
+        
+        with open(path) as f:
+            records = [json.loads(line) for line in f]
+        assert [r["data"]["name"]["value"] for r in records] == ["John Doe", "Jane"]
+        assert records[1]["metadata"] == {"mode": "speed"}
+
+
+class TestCSVOutputHandler:
+    def test_header_written_once(self, tmp_path):
+        path = tmp_path / "submissions.csv"
+        handler = CSVOutputHandler(str(path))
+        handler.save({"name": {"value": "John"}})
+        handler.save({"name": {"value": "Jane"}})
+        handler.close()
+        with open(path, newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == ["name", "timestamp"]
+        assert [row[0] for row in rows[1:]] == ["John", "Jane"]
+    
+    def test_appends_without_header_to_existing_file(self, tmp_path):
+        path = tmp_path / "submissions.csv"
+        first = CSVOutputHandler(str(path))
+        first.save({"name": {"value": "John"}})
+        first.close()
+        second = CSVOutputHandler(str(path))
+        second.save({"name": {"value": "Jane", "notes": ["Approximate value provided"]}})
+        second.close()
+        with open(path, newline="") as f:
+            rows = list(csv.reader(f))
+        assert len(rows) == 3
+        assert rows[2][:2] == ["Jane", "Approximate value provided"]
+    
+    def test_field_ids_fix_the_columns(self, tmp_path):
+        path = tmp_path / "submissions.csv"
+        handler = CSVOutputHandler(str(path), field_ids=["name", "email"])
+        handler.save({"email": {"value": "jane@example.com"}, "name": {"value": "Jane"}})
+        handler.save({"name": {"value": "John", "notes": ["a", "b"]}})
+        handler.close()
+        with open(path, newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == ["name", "name_notes", "email", "email_notes", "timestamp"]
+        assert rows[1][:4] == ["Jane", "", "jane@example.com", ""]
+        assert rows[2][:4] == ["John", "a; b", "", ""]
+
+
+class _RecordingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive
+    
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.received.append((self.client_address, json.loads(body)))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+    
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def webhook_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RecordingHandler)
+    server.received = []
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestWebhookOutputHandler:
+    def test_posts_json_over_one_connection(self, webhook_server):
+        url = f"http://127.0.0.1:{webhook_server.server_port}/hook"
+        handler = WebhookOutputHandler(url)
+        handler.save({"name": {"value": "John"}})
+        handler.save({"name": {"value": "Jane"}}, metadata={"mode": "speed"})
+        handler.close()
+        
+        (addr1, first), (addr2, second) = webhook_server.received
+        assert first["data"] == {"name": {"value": "John"}}
+        assert second["metadata"] == {"mode": "speed"}
+        assert addr1 == addr2  # Same client socket, so the connection was reused
+    
+    def test_batches_are_posted_as_arrays(self, webhook_server):
+        url = f"http://127.0.0.1:{webhook_server.server_port}/hook"
+        handler = WebhookOutputHandler(url, batch_size=2)
+        futures = [handler.submit({"n": {"value": i}}) for i in range(3)]
+        assert futures[0] is futures[1]
+        assert "Status: 200" in futures[0].result(timeout=5)
+        assert not futures[2].done()
+        handler.close()
+        
+        batches = [[p["data"]["n"]["value"] for p in body] for _, body in webhook_server.received]
+        assert batches == [[0, 1], [2]]
+        assert futures[2].done()
+    
+    def test_flush_interval_sends_partial_batch(self, webhook_server):
+        url = f"http://127.0.0.1:{webhook_server.server_port}/hook"
+        handler = WebhookOutputHandler(url, batch_size=10, flush_interval=0.05)
+        future = handler.submit({"n": {"value": 0}})
+        assert "Status: 200" in future.result(timeout=5)
+        handler.close()
+        assert len(webhook_server.received) == 1
+
+
+class TestDatabaseOutputHandler:
+    def test_stores_json_text(self, tmp_path):
+        db_path = tmp_path / "submissions.db"
+        handler = DatabaseOutputHandler(str(db_path))
+        handler.save(SAMPLE)
+        handler.close()
+        conn = sqlite3.connect(db_path)
+        data, metadata = conn.execute("SELECT data, metadata FROM submissions").fetchone()
+        conn.close()
+        assert json.loads(data)["name"]["value"] == "John Doe"
+        assert json.loads(metadata) == {}
+    
+    def test_save_many_inserts_all_rows(self, tmp_path):
+        db_path = tmp_path / "submissions.db"
+        handler = DatabaseOutputHandler(str(db_path))
+        handler.save_many([({"n": {"value": i}}, {"batch": True}) for i in range(3)])
+        handler.save({"n": {"value": 3}})
+        handler.close()
+        conn = sqlite3.connect(db_path)
+        rows = conn.execute("SELECT data FROM submissions ORDER BY id").fetchall()
+        conn.close()
+        assert [json.loads(row[0])["n"]["value"] for row in rows] == [0, 1, 2, 3]
+    
+    def test_background_writer_batches_queued_rows(self, tmp_path):
+        db_path = tmp_path / "submissions.db"
+        handler = DatabaseOutputHandler(str(db_path), background=True, max_batch=2)
+        results = [handler.save({"n": {"value": i}}) for i in range(5)]
+        assert all(r.startswith("Queued") for r in results)
+        handler.flush()
+        conn = sqlite3.connect(db_path)
+        rows = conn.execute("SELECT data FROM submissions ORDER BY id").fetchall()
+        conn.close()
+        assert [json.loads(row[0])["n"]["value"] for row in rows] == [0, 1, 2, 3, 4]
+        handler.save({"n": {"value": 5}})
+        handler.close()
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("SELECT COUNT(*) FROM submissions").fetchone() == (6,)
+        conn.close()
@@ -0,0 +1,67 @@
+"""Tests for the question prefetcher."""
+
+import asyncio
+import threading
+from src.prefetch import QuestionPrefetcher, wait_for_result
+
+
+class TestQuestionPrefetcher:
+    def test_pop_returns_submitted_result(self):
+        prefetcher = QuestionPrefetcher()
+        prefetcher.submit(("email", "name: Ada"), lambda label: f"What is your {label}?", "email")
+        future = prefetcher.pop(("email", "name: Ada"))
+        assert future is not None
+        assert future.result(timeout=1) == "What is your email?"
+        assert len(prefetcher) == 0
+    
+    def test_pop_unknown_key_is_miss(self):
+        prefetcher = QuestionPrefetcher()
+        prefetcher.submit(("email", "name: Ada"), lambda: "question")
+        assert prefetcher.pop(("email", "name: Bob")) is None
+    
+    def test_duplicate_submit_is_ignored(self):
+        calls = []
+        prefetcher = QuestionPrefetcher()
+        prefetcher.submit("key", calls.append, 1)
+        prefetcher.submit("key", calls.append, 2)
+        prefetcher.pop("key").result(timeout=1)
+        assert calls == [1]
+    
+    def test_cancel_discards_pending(self):
+        prefetcher = QuestionPrefetcher()
+        prefetcher.submit("key", lambda: "question")
+        prefetcher.cancel("key")
+        assert prefetcher.pop("key") is None
+    
+    def test_oldest_is_evicted_over_capacity(self):
+        release = threading.Event()
+        prefetcher = QuestionPrefetcher(max_workers=1, max_pending=2)
+        for key in ("a", "b", "c"):
+            prefetcher.submit(key, release.wait, 1)
+        assert len(prefetcher) == 2
+        assert prefetcher.pop("a") is None
+        release.set()
+    
+    def test_submit_async_runs_on_event_loop(self):
+        async def ask(label):
+            return f"What is your {label}?"
+        
+        async def main():
+            prefetcher = QuestionPrefetcher()
+            prefetcher.submit_async("key", ask, "email")
+            return await wait_for_result(prefetcher.pop("key"))
+        
+        assert asyncio.run(main()) == "What is your email?"
+    
+    def test_task_from_another_loop_is_miss(self):
+        prefetcher = QuestionPrefetcher()
+        
+        async def start():
+            prefetcher.submit_async("key", asyncio.sleep, 0)
+        
+        asyncio.run(start())
+        
+        async def take():
+            return prefetcher.pop("key")
+        
+        assert asyncio.run(take()) is None
@@ -1,7 +1,10 @@
 """Tests for utility functions."""
 
+import asyncio
 import pytest
+from langchain_core.messages import AIMessage, HumanMessage
 from src.utils import (
+    ainput,
     get_field,
     get_ordered_fields,
     get_field_index,
@@ -63,6 +66,16 @@ class TestGetFieldIndex:
     def test_get_index_not_found(self):
         fields = [{"id": "field1"}]
         assert get_field_index("nonexistent", fields) == -1
+    
+    def test_get_index_sees_appended_fields(self):
+        fields = [{"id": "field1"}]
+        assert get_field_index("field2", fields) == -1
+        fields.append({"id": "field2"})
+        assert get_field_index("field2", fields) == 1
+    
+    def test_get_index_first_duplicate_wins(self):
+        fields = [{"id": "field1"}, {"id": "field1"}]
+        assert get_field_index("field1", fields) == 0
 
 
 class TestGetLastUserMessage:
@@ -84,6 +97,17 @@ class TestGetLastUserMessage:
         }
         message = get_last_user_message(state)
         assert message == ""
+    
+    def test_get_message_from_message_objects(self):
+        state = {
+            "messages": [
+                HumanMessage(content="First"),
+                AIMessage(content="Question?"),
+                HumanMessage(content="Second"),
+                AIMessage(content="Another question?"),
+            ]
+        }
+        assert get_last_user_message(state) == "Second"
 
 
 class TestShouldShowField:
@@ -132,3 +156,14 @@ class TestShouldShowField:
         collected = {}
         assert should_show_field(field, collected) is False
 
+
+class TestAInput:
+    def test_returns_line(self, monkeypatch):
+        monkeypatch.setattr("builtins.input", lambda prompt="": "hello")
+        assert asyncio.run(ainput("You: ")) == "hello"
+    
+    def test_eof_returns_none(self, monkeypatch):
+        def raise_eof(prompt=""):
+            raise EOFError
+        monkeypatch.setattr("builtins.input", raise_eof)
+        assert asyncio.run(ainput("You: ")) is None
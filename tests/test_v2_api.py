@@ -104,6 +104,33 @@ def test_answer_flow():
     assert "collected_fields" in result_data
 
 
+def test_answer_stream_flow():
+    """Test that streaming an answer emits SSE events ending with done."""
+    start_response = client.post(
+        "/api/forms/start",
+        json={"form_id": "employment_onboarding", "mode": "speed"}
+    )
+    session_id = start_response.json()["session_id"]
+    
+    response = client.post(
+        "/api/forms/answer/stream",
+        json={"session_id": session_id, "message": "U.S. citizen"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert "event: field" in response.text
+    assert "event: done" in response.text
+
+
+def test_answer_stream_invalid_session():
+    """Test streaming an answer with invalid session_id."""
+    response = client.post(
+        "/api/forms/answer/stream",
+        json={"session_id": "nonexistent_session", "message": "test"}
+    )
+    assert response.status_code == 404
+
+
 def test_answer_invalid_session():
     """Test submitting answer with invalid session_id."""
     response = client.post(
@@ -122,3 +149,20 @@ def test_get_result_invalid_session():
     data = response.json()
     assert "detail" in data
 
+
+
+def test_answer_returns_next_question():
+    """Test that the answer response carries the newly asked question."""
+    start_response = client.post(
+        "/api/forms/start",
+        json={"form_id": "employment_onboarding", "mode": "speed"}
+    )
+    start_data = start_response.json()
+    
+    answer_response = client.post(
+        "/api/forms/answer",
+        json={"session_id": start_data["session_id"], "message": "U.S. citizen"}
+    )
+    question = answer_response.json()["question"]
+    assert question
+    assert question != start_data["question"]
@@ -1,4 +1,5 @@
 from src.v2.session import create_session
+from src.nodes import get_config
 
 
 def test_create_session_employment_onboarding():
@@ -28,3 +29,9 @@ def test_create_session_rental_application():
         pass
 
 
+def test_sessions_share_one_config_per_mode():
+    first = create_session("employment_onboarding", mode="speed")
+    second = create_session("rental_application", mode="speed")
+
+    assert first["config"] is second["config"]
+    assert get_config() is second["config"]
@@ -0,0 +1,35 @@
+"""Tests for V2.0 session metadata stores."""
+
+import time
+
+from src.v2.session_store import MemorySessionStore
+
+
+def test_memory_store_put_and_get():
+    store = MemorySessionStore()
+    store.put("s1", {"form_id": "employment_onboarding", "mode": "speed"})
+    assert store.get("s1") == {"form_id": "employment_onboarding", "mode": "speed"}
+    assert store.get("missing") is None
+
+
+def test_memory_store_expires_and_evicts():
+    evicted = []
+    store = MemorySessionStore(ttl=0.01, on_evict=evicted.append)
+    store.put("old", {"mode": "speed"})
+    time.sleep(0.02)
+    store.put("new", {"mode": "speed"})
+    assert evicted == ["old"]
+    assert store.get("old") is None
+    assert store.get("new") == {"mode": "speed"}
+
+
+def test_memory_store_keeps_sessions_in_use():
+    evicted = []
+    store = MemorySessionStore(ttl=0.2, on_evict=evicted.append)
+    store.put("active", {"mode": "speed"})
+    time.sleep(0.12)
+    assert store.get("active") == {"mode": "speed"}
+    time.sleep(0.12)  # Past the TTL counted from `put`
+    store.put("other", {"mode": "speed"})
+    assert store.get("active") == {"mode": "speed"}
+    assert evicted == []
@@ -26,6 +26,10 @@ class TestEmailValidation:
         is_valid, errors = validate_email("user@mail.example.com", {})
         assert is_valid
 
+    def test_email_with_trailing_text(self):
+        is_valid, errors = validate_email("test@example.com\n", {})
+        assert not is_valid
+
 
 class TestPhoneValidation:
     def test_valid_phone_10_digits(self):